@@ -11,7 +11,7 @@ Contains
 # === Imports ===
 
 from ....general.display_config import Bars, Styles, FormattingDefaults as DF, \
-                     Formatting as F, Terminal as Terminal
+                     Formatting as F, LEFT_PADDING
 from ....general.exceptions import field_error
 
 from rich.console import Console
@@ -52,8 +52,8 @@ def default_formatting(string: str) -> Text:
 
     # normal formatting
     else:
-        t.highlight_regex(DF.DIGIT_REGEX, DF.DIGIT_STYLE)    # digit coloring
-        t.highlight_regex(DF.QUOTED_REGEX, DF.QUOTED_STYLE)  # text coloring
+        t.highlight_regex(DF.DIGIT_PATTERN, DF.DIGIT_STYLE)    # digit coloring
+        t.highlight_regex(DF.QUOTED_PATTERN, DF.QUOTED_STYLE)  # text coloring
 
     return t
 
@@ -356,7 +356,7 @@ def print_piped_line(console: Console,
     left_sep, right_sep = _get_pipe_seps(cols, side)
 
     if side == 'l':
-        left_sep = f'{Terminal.LEFT_PADDING}{left_sep}'
+        left_sep = f'{LEFT_PADDING}{left_sep}'
 
     console.print(
                   left_sep,
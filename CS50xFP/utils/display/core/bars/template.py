@@ -6,7 +6,8 @@ from rich.console import Console
 from typing import Literal
 
 from .lines import print_piped_line, format_centered_text as fc_text
-from ....general.display_config import Bars, Styles, Terminal as Terminal
+from ....general.display_config import Bars, Styles, LEFT_PADDING, \
+                                        MIN_TERM_WIDTH
 from ....general.exceptions import field_error
 
 
@@ -34,7 +35,7 @@ class BarTemplate:
     def __init__(self,
                  console: Console | None = None,
                  has_center_column: bool = False,
-                 width: int = Terminal.MIN_TERM_WIDTH,
+                 width: int = MIN_TERM_WIDTH,
                  triple_top: bool = False,
                  double_sep_top: bool = False
                 ) -> None:
@@ -166,7 +167,7 @@ class BarTemplate:
                 raise field_error('pos', pos, "'t', 'm', or 'b'")
 
         # render
-        self.console.print(f'{Terminal.LEFT_PADDING}{self.sep[pos]}')
+        self.console.print(f'{LEFT_PADDING}{self.sep[pos]}')
 
 
 
@@ -211,14 +212,14 @@ class BarTemplate:
 
         if not self.triple_top:
             self.console.print(
-                Terminal.LEFT_PADDING, "║",
+                LEFT_PADDING, "║",
                 *fc_text(t_s[0][0], 'c', t_s[0][1], self.width),
                 sep=''
             )
 
         else:
             self.console.print(
-                Terminal.LEFT_PADDING, '║',
+                LEFT_PADDING, '║',
 
                 *fc_text(t_s[0][0], 'l', t_s[0][1], Bars.TOP_SECTIONS[0]),
                 *fc_text(t_s[1][0], 'c', t_s[1][1], Bars.TOP_SECTIONS[1]),
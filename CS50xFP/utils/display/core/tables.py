@@ -7,10 +7,16 @@ Contains
 - print_table_mtfs
 - print_table_scps
 - print_table_users
+
+- make_table_audit_logs
+- make_table_mtfs
+- make_table_scps
+- make_table_users
 """
 
 from typing import Callable, Type, TypeVar
 
+from rich.text import Text
 from tabulate import tabulate
 
 from ...sql.transformers.formatters import FormatIDs
@@ -55,15 +61,20 @@ def _f_user_name(usr: Models.User) -> str:
     return f'{usr.title.name} {usr.name}'
 
 
-def print_table(data: list[dict[str, str]]) -> None:
+def format_table(data: list[dict[str, str]]) -> str:
     """
-    Prints a formatted table from a list of dicts
+    Formats a table from a list of dicts
 
     Parameters
     ----------
     data : list[dict[str,str]]
         The data to be displayed
 
+    Returns
+    -------
+    str
+        The rendered table
+
     Raises
     ------
     ValueError
@@ -95,11 +106,27 @@ def print_table(data: list[dict[str, str]]) -> None:
                         )
 
     # format table
-    table_str = _replace_chars(table_str).split('\n')
+    return _replace_chars(table_str)
+
+
+def print_table(data: list[dict[str, str]]) -> None:
+    """
+    Prints a formatted table from a list of dicts
+
+    Parameters
+    ----------
+    data : list[dict[str,str]]
+        The data to be displayed
 
-    # print
-    for line in table_str:
-        print(line)
+    Raises
+    ------
+    ValueError
+        If `data` is empty
+    TypeError
+        - If any element in `data` is not a dict
+        - If any key or value in the dicts is not a string
+    """
+    print(format_table(data))
 
 
 
@@ -150,6 +177,23 @@ def _format_audit_log(log: Models.AuditLog) -> dict[str, str]:
            }
 
 
+def _format_generic_table(
+                          data: list[T],
+                          formatter: Callable[[T], dict[str, str]]
+                         ) -> str:
+    """
+    A generic table formatter
+
+    **NOT TO BE IMPORTED OR USED OUTSIDE `tables.py`**
+    """
+    # validation
+    if not data:
+        raise ValueError('data must contain at least one entry')
+
+    dict_data = [formatter(entry) for entry in data]
+
+    return format_table(dict_data)
+
 def _print_generic_table(
                          data: list[T],
                          formatter: Callable[[T], dict[str, str]]
@@ -159,13 +203,21 @@ def _print_generic_table(
 
     **NOT TO BE IMPORTED OR USED OUTSIDE `tables.py`**
     """
-    # validation
-    if not data:
-        raise ValueError('data must contain at least one entry')
+    print(_format_generic_table(data, formatter))
 
-    dict_data = [formatter(entry) for entry in data]
+def _make_generic_table(
+                        data: list[T],
+                        formatter: Callable[[T], dict[str, str]]
+                       ) -> Text:
+    """
+    A generic table renderable builder (for rich `Group`s)
 
-    print_table(dict_data)
+    **NOT TO BE IMPORTED OR USED OUTSIDE `tables.py`**
+    """
+    return Text(
+                _format_generic_table(data, formatter),
+                no_wrap=True, overflow='ignore'
+               )
 
 
 
@@ -248,11 +300,106 @@ def print_table_users(data: list[Models.User | RefModels.User]) -> None:
 
 
 
+def make_table_audit_logs(data: list[Models.AuditLog]) -> Text:
+    """
+    Builds a renderable table of audit logs
+    (`print_table_audit_logs` for rich `Group`s)
+
+    Parameters
+    ----------
+    data : list[Models.AuditLog]
+        The audit logs to be displayed
+
+    Returns
+    -------
+    Text
+        The rendered table
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty
+    """
+    return _make_generic_table(data, _format_audit_log)
+
+def make_table_mtfs(data: list[Models.MTF | RefModels.MTF]) -> Text:
+    """
+    Builds a renderable table of MTFs
+    (`print_table_mtfs` for rich `Group`s)
+
+    Parameters
+    ----------
+    data : list[Models.MTF | RefModels.MTF]
+        The MTFs to be displayed
+
+    Returns
+    -------
+    Text
+        The rendered table
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty
+    """
+    return _make_generic_table(data, _format_mtf)
+
+def make_table_scps(data: list[Models.SCP | RefModels.SCP]) -> Text:
+    """
+    Builds a renderable table of SCPs
+    (`print_table_scps` for rich `Group`s)
+
+    Parameters
+    ----------
+    data : list[Models.SCP | RefModels.SCP]
+        The SCPs to be displayed
+
+    Returns
+    -------
+    Text
+        The rendered table
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty
+    """
+    return _make_generic_table(data, _format_scp)
+
+def make_table_users(data: list[Models.User | RefModels.User]) -> Text:
+    """
+    Builds a renderable table of users
+    (`print_table_users` for rich `Group`s)
+
+    Parameters
+    ----------
+    data : list[Models.User | RefModels.User]
+        The users to be displayed
+
+    Returns
+    -------
+    Text
+        The rendered table
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty
+    """
+    return _make_generic_table(data, _format_user)
+
+
+
 # === Exports ===
 
 __all__ = [
            'print_table_audit_logs',
            'print_table_mtfs',
            'print_table_scps',
-           'print_table_users'
+           'print_table_users',
+
+           'make_table_audit_logs',
+           'make_table_mtfs',
+           'make_table_scps',
+           'make_table_users'
           ]
@@ -14,10 +14,33 @@ Contains
 
 from .core.boxes import basic_box_with_text
 from ..general.display_config import CreateMessages as CM, \
-                                     GeneralMessages as GM
+                                     GeneralMessages as GM, Styles
+from ..general.server_config import Server
 from ..general.validation import validate_str, validate_int
 
 
+
+# === Precomputed messages ===
+# (clearance levels & file types are a small fixed set,
+#  so format them once instead of on every call)
+
+_CLEAR_LVLS = [str(lvl) for lvl in range(1, len(Styles.CLEAR_LVL))]
+
+_CLEAR_REQ = {
+    lvl: CM.CLEAR_REQUIRED.format(needed_clear=lvl) for lvl in _CLEAR_LVLS
+}
+"""`CM.CLEAR_REQUIRED` formatted for each clearance level"""
+_USR_CLEAR = {
+    lvl: CM.USER_CLEAR.format(usr_clearance=lvl) for lvl in _CLEAR_LVLS
+}
+"""`CM.USER_CLEAR` formatted for each clearance level"""
+_NOT_VALID = {
+    f_type: CM.NOT_VALID.format(f_type=f_type)
+    for f_type in Server.VALID_F_TYPES
+}
+"""`CM.NOT_VALID` formatted for each known file type"""
+
+
 def create_f(f_type: str) -> None:
     """
     Prints a simple message for file creation
@@ -82,10 +105,14 @@ def clearance_denied(
     basic_box_with_text(
                         [CM.INSUFFICIENT_CLEAR_BOX],
                         [
-                         CM.CLEAR_REQUIRED.format(
+                         _CLEAR_REQ.get(required_clearance)
+                         or CM.CLEAR_REQUIRED.format(
                             needed_clear=required_clearance
                          ),
-                         CM.USER_CLEAR.format(usr_clear=user_clearance)
+                         _USR_CLEAR.get(user_clearance)
+                         or CM.USER_CLEAR.format(
+                            usr_clearance=user_clearance
+                         )
                         ]
                        )
 
@@ -115,7 +142,10 @@ def invalid_f_type(f_type: str) -> None:
 
     basic_box_with_text(
                         [CM.INVALID_FD_BOX],
-                        [CM.NOT_VALID.format(f_type=f_type)]
+                        [
+                         _NOT_VALID.get(f_type)
+                         or CM.NOT_VALID.format(f_type=f_type)
+                        ]
                        )
 
 
@@ -11,12 +11,13 @@ Contains
 
 from urllib.parse import unquote
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.markdown import Markdown as Md
 
 from .core.bars import acs_bar, site_bar, mtf_bar, user_bar
-from .core.tables import print_table_users, print_table_mtfs, \
-                         print_table_scps
-from .helpers import print_md, print_md_title
+from .core.tables import make_table_users, make_table_mtfs, \
+                         make_table_scps
+from .helpers import print_md_title
 from ..general.validation import validate_str
 from ..sql.transformers import Models
 
@@ -245,15 +246,12 @@ def display_site(
     # now desc
     print_md_title('Site Description', site_desc, console)
 
-    # now tables
-    print_md('## Site Staff', console)
-    print_table_users(info.staff)
-
-    print_md('## Site MTFs', console)
-    print_table_mtfs(info.mtfs)
-
-    print_md('## Site SCPs', console)
-    print_table_scps(info.scps)
+    # now tables (grouped so rich renders them in one pass)
+    console.print(Group(
+        Md('## Site Staff'), make_table_users(info.staff),
+        Md('## Site MTFs'), make_table_mtfs(info.mtfs),
+        Md('## Site SCPs'), make_table_scps(info.scps),
+    ))
 
     # now additional files
     _display_additional_files(additional, console)
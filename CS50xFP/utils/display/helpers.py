@@ -4,6 +4,7 @@ Helpers for display functions
 Contains
 --------
 - printc()
+- printc_overwrite()
 - print_lines()
 - print_md()
 - print_md_title()
@@ -12,21 +13,57 @@ Contains
 - timestamp()
 """
 
-from ..general.display_config import Terminal
+from ..general.display_config import SIZE
 
+import sys
+from functools import lru_cache
 from os import name, system
-from datetime import datetime
+from time import time as _time, strftime as _strftime, localtime as _localtime
 from rich.console import Console
 from rich.markdown import Markdown as Md
 from ..general.validation import validate_str, validate_field
 
 
+# SIZE is fixed at import, so bake it into the centering templates
+_CENTER_FMT = ('{:^' + str(SIZE) + '}').format
+"""Centers a string to the terminal size"""
+
+_ELLIPSIS = '...'
+"""Suffix for truncated strings"""
+_TRUNC_LEN = SIZE - len(_ELLIPSIS)
+"""Length to cut strings down to before adding `_ELLIPSIS`"""
+
+_CLEAR_SEQ = '\x1b[2J\x1b[H'
+"""ANSI escape sequence to erase the display & move the cursor home"""
+
+_TIMESTAMP_FMT = '%Y/%m/%d - %H:%M:%S'
+"""strftime format used by `timestamp()`"""
+
+_last_ts_sec = -1
+"""Epoch second `_last_ts_str` was formatted for"""
+_last_ts_str = ''
+"""Last string returned by `timestamp()`"""
+
+if name == 'nt':  # enable VT processing on legacy windows consoles
+    system('')
+
+
+@lru_cache(maxsize=128)
+def _cached_md(text: str) -> Md:
+    """
+    Returns a (cached) parsed `Md` for `text`
+
+    `Md` parses on init and can be rendered repeatedly,
+    so recurring texts skip markdown parsing entirely
+    """
+    return Md(text)
+
+
 def printc(
            string: str,
            end: str = '\n',
            flush: bool = False,
-           truncate: bool = True,
-           overwrite: bool = False
+           truncate: bool = True
           ) -> None:
     """
     Prints `string` centered to the terminal size
@@ -42,29 +79,64 @@ def printc(
         whether to forcibly flush `string`
     truncate : bool
         whether to truncate `string` if longer than terminal size
-    overwrite : bool
-        whether to overwrite the current line instead of printing a new one (carriage return)
+
+    Notes
+    -----
+    - To overwrite the current line (carriage return), use `printc_overwrite()`
     """
 
-    # validation
-    validate_field('string', string, str)
-    validate_field('end', end, str)
-    validate_field('flush', flush, bool)
-    validate_field('truncate', truncate, bool)
-    validate_field('overwrite', overwrite, bool)
+    # validation (stripped under `python -O`)
+    if __debug__:
+        validate_field('string', string, str)
+        validate_field('end', end, str)
+        validate_field('flush', flush, bool)
+        validate_field('truncate', truncate, bool)
 
     # print
-    if string == '':
+    n = len(string)
+
+    if n == 0:
         print(end=end, flush=flush)
         return
 
-    elif truncate and len(string) > Terminal.SIZE:
-        string = f'{string[:Terminal.SIZE-3]}...'
+    elif truncate and n > SIZE:
+        string = string[:_TRUNC_LEN] + _ELLIPSIS
 
-    if overwrite:
-        print(f'\r{string:^{Terminal.SIZE}}', end=end, flush=flush)
-    else:
-        print(f'{string:^{Terminal.SIZE}}', end=end, flush=flush)
+    print(_CENTER_FMT(string), end=end, flush=flush)
+
+def printc_overwrite(string: str) -> None:
+    """
+    Overwrites the current line with `string` centered to the terminal size
+    (Does not handle ANSI codes or wide unicode chars)
+
+    Parameters
+    ----------
+    string : str
+        string to print (truncated if longer than terminal size)
+
+    Notes
+    -----
+    - Hot path for loading animations, so padding is computed directly
+      instead of going through `str.format`
+    - Writes no newline and always flushes
+    """
+
+    # validation (stripped under `python -O`)
+    if __debug__:
+        validate_field('string', string, str)
+
+    n = len(string)
+
+    if n > SIZE:
+        string = string[:_TRUNC_LEN] + _ELLIPSIS
+        n = SIZE
+
+    # same split as '^' (extra space on the right)
+    pad = SIZE - n
+    left = pad >> 1
+
+    sys.stdout.write('\r' + ' ' * left + string + ' ' * (pad - left))
+    sys.stdout.flush()
 
 def print_lines(
                 lines: list[str]  # possible later: accept generators
@@ -81,16 +153,34 @@ def print_lines(
     ------
     TypeError
         If `lines` is not a list of strings
+
+    Notes
+    -----
+    - Output matches calling `printc(line)` for each line,
+      but is built in memory and written once
     """
 
-    # validation
-    validate_field('lines', lines, list)
-    for line in lines:
-        validate_field('lines item', line, str)
+    # validation (stripped under `python -O`)
+    if __debug__:
+        validate_field('lines', lines, list)
+        for line in lines:
+            validate_field('lines item', line, str)
 
-    # print
+    # build output
+    out = []
     for line in lines:
-        printc(line)
+        if len(line) > SIZE:
+            line = line[:_TRUNC_LEN] + _ELLIPSIS
+
+        out.append(_CENTER_FMT(line) if line else '')
+
+    # print (trailing '' gives the final newline)
+    out.append('')
+    sys.stdout.write('\n'.join(out))
+
+def _print_md_unchecked(text: str, console: Console) -> None:
+    """`print_md()` without validation (for already validated callers)"""
+    console.print(_cached_md(text))
 
 def print_md(
              text: str,
@@ -116,12 +206,13 @@ def print_md(
 
     Notes
     -----
-    Calls `console.print(Md(`text`))`
+    - Calls `console.print(Md(`text`))`
+    - Parsed markdown is cached per `text` (LRU, 128 entries)
     """
     validate_str('text', text)
     validate_field('console', console, Console)
 
-    console.print(Md(text))
+    _print_md_unchecked(text, console)
 
 def print_md_title(
                    title: str,
@@ -154,36 +245,26 @@ def print_md_title(
     -----
     - Title is printed as a level 2 markdown header
     - Calls `print_md(f'## {title}\n{text}', console)`
+      (without revalidating)
     """
 
     validate_str('title', title)
     validate_str('text', text)
+    validate_field('console', console, Console)
 
-    print_md(f'## {title}\n{text}', console)
+    _print_md_unchecked(f'## {title}\n{text}', console)
 
 
 def clear() -> None:
     """
     Clears the screen
-    """
-
-    # determine clear command
-    if name == 'nt':       # OS is windows
-        command = 'cls'
-    else:                  # OS is mac or linux (or any other I guess,
-        command = 'clear'  #                     it's an else statement...)
-
-    # execute clear command
-    try:
-        result = system(command)
 
-    # error handling
-    except OSError as e:
-        raise OSError(f'Clear command ({command!r}) failed: {e}') from e
-    if result != 0:
-        raise OSError(
-            f'Clear command ({command!r}) failed with exit code {result}'
-        )
+    Notes
+    -----
+    - Writes `_CLEAR_SEQ` directly instead of spawning `clear`/`cls`
+    """
+    sys.stdout.write(_CLEAR_SEQ)
+    sys.stdout.flush()
 
 
 def timestamp() -> str:
@@ -197,5 +278,18 @@ def timestamp() -> str:
     current_datetime : str
         The current datetime formatted as: YYYY/MM/DD - HH:MM:SS
         Example: 2024/06/01 - 14:30:15
+
+    Notes
+    -----
+    - Result is cached per second, so repeat calls
+      within the same second skip formatting
     """
-    return datetime.now().strftime('%Y/%m/%d - %H:%M:%S')
+    global _last_ts_sec, _last_ts_str
+
+    sec = int(_time())
+
+    if sec != _last_ts_sec:
+        _last_ts_sec = sec
+        _last_ts_str = _strftime(_TIMESTAMP_FMT, _localtime(sec))
+
+    return _last_ts_str
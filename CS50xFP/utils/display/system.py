@@ -9,7 +9,7 @@ Contains
 
 from typing import Literal
 
-from .helpers import clear, printc, print_lines
+from .helpers import clear, printc, printc_overwrite, print_lines
 from .core.boxes import fancy_box, fancy_box_with_text
 from ..general.display_config import FancyLogin as FL, Logins, Load
 from ..general.validation import validate_field, validate_str
@@ -42,7 +42,7 @@ def sim_load() -> None:
 
         for i in range(1, 4): # three dots
             sleep(uniform(min_t, max_t))
-            printc(f'{line}{" ." * i}', end='', flush=True, overwrite=True) # one char over 😭
+            printc_overwrite(f'{line}{" ." * i}') # one char over 😭
 
         # occasional hiccup for 'lag'
         if uniform(0, 1) < Load.HICCUP_PROBABILITY:
@@ -89,9 +89,8 @@ def startup() -> None:
                ])
 
 
-def _f_line(line: str) -> str:
-        """Helper to format a line for `_gen_login_lines()`"""
-        return f'{FL.L_R}{line:^{FL.CONTENT_WIDTH}}{FL.L_R}'
+_f_line = FL.LINE.format
+"""Helper to format a line for `_gen_login_lines()`"""
 
 def _gen_login_lines(title: str, name: str) -> list[str]:
     """
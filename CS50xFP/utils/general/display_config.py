@@ -11,10 +11,14 @@ Contains
 - General
 - Load
 - Login
+
+- SIZE, LEFT_PADDING, MIN_TERM_WIDTH (snapshots of `Terminal`)
 """
 
-from collections import defaultdict
+import re
+import sys
 from dataclasses import dataclass
+from types import MappingProxyType
 
 # disable markdown_it logging
 # (causes problems with rich if not disabled)
@@ -68,7 +72,7 @@ class Styles:
     - CONT_CLASS
     """
 
-    CLEAR_LVL = [
+    CLEAR_LVL = (
         '',
         '#009F6B',
         '#0087BD',
@@ -76,7 +80,7 @@ class Styles:
         '#FF6D00',
         '#C40233',
         '#850005'
-    ]
+    )
     """
     Hex colour codes used in clearance level rendering
 
@@ -87,20 +91,18 @@ class Styles:
     OTHER_CONT_CLASS = 'dim italic'
     """rich style used for containment classes not in CONT_CLASS"""
 
-    CONT_CLASS = defaultdict(
-        lambda: Styles.OTHER_CONT_CLASS,
-        {
-            'Safe': CLEAR_LVL[1],
-            'Euclid': CLEAR_LVL[3],
-            'Keter': CLEAR_LVL[5],
-        }
-    )
+    CONT_CLASS = MappingProxyType({
+        'Safe': CLEAR_LVL[1],
+        'Euclid': CLEAR_LVL[3],
+        'Keter': CLEAR_LVL[5],
+    })
     """
     Styles used in containment class & secondary class rendering
 
     keys are containment classes
-    (eg, CONT_CLASS_COLOURS['Safe'] is used for Safe class)
-    If a class is not in the keys, OTHER_CONT_CLASS is used
+    (eg, CONT_CLASS['Safe'] is used for Safe class)
+    If a class is not in the keys, use OTHER_CONT_CLASS:
+        >>> Styles.CONT_CLASS.get(name, Styles.OTHER_CONT_CLASS)
     """
 
 
@@ -115,8 +117,10 @@ class FormattingDefaults:
     Contains
     --------
     - DIGIT_REGEX
+    - DIGIT_PATTERN
     - DIGIT_STYLE
     - QUOTED_REGEX
+    - QUOTED_PATTERN
     - QUOTED_STYLE
 
     - SPECIAL_TEXTS
@@ -126,15 +130,19 @@ class FormattingDefaults:
 
     DIGIT_REGEX = r'(?<!O)5|[0-46-9]'
     """Regex pattern matching digits, excluding O5"""
+    DIGIT_PATTERN = re.compile(DIGIT_REGEX)
+    """Compiled `DIGIT_REGEX`"""
     DIGIT_STYLE = 'cyan bold'
     """rich style for digits"""
 
     QUOTED_REGEX = r'".+?"'
     """Regex pattern matching text in double quotes"""
+    QUOTED_PATTERN = re.compile(QUOTED_REGEX)
+    """Compiled `QUOTED_REGEX`"""
     QUOTED_STYLE = 'green'
     """rich style for quoted text"""
 
-    SPECIAL_TEXTS = ['[DATA EXPUNGED]', 'None', 'Inactive']
+    SPECIAL_TEXTS = frozenset({'[DATA EXPUNGED]', 'None', 'Inactive'})
     """Texts styled with `Styles.OTHER_CONT_CLASS`"""
 
     ACTIVE_TEXT = 'Active'
@@ -174,7 +182,7 @@ class Bars:
     - TEXT_WIDTH
     """
 
-    TOP_SECTIONS = [32, 52, 32]
+    TOP_SECTIONS = (32, 52, 32)
     """Width of text areas of the top bar (left, center, right)"""
 
     TEXT_WIDTH = 58
@@ -211,41 +219,48 @@ class Terminal:
     (largest fixed-width display is 120 chars)
     """
 
-    @staticmethod
-    def _validate_term_width(width: int) -> None:
-        """validates terminal width is at least MIN_TERM_WIDTH"""
-        if width < Terminal.MIN_TERM_WIDTH:
-            raise RuntimeError(
-                f'Terminal width too small for proper display: '
-                f'got {width}, need at least {Terminal.MIN_TERM_WIDTH}'
-            )
+    SIZE: int
+    """Terminal width in columns, adjusted to be even"""
 
-    @staticmethod
-    def _get_term_width() -> int:
-        """gets terminal width, adjusted to be even"""
-        try:
-            from os import get_terminal_size
+    LEFT_PADDING: str
+    """Spaces to center 120 char content in terminal"""
 
-            width = get_terminal_size().columns
-            width = width - (width % 2) # make even
 
-            Terminal._validate_term_width(width)
-            return width
+def _get_term_width() -> int:
+    """
+    gets terminal width, adjusted to be even,
+    and validates it is at least `Terminal.MIN_TERM_WIDTH`
 
-        except Exception as e:
-            raise RuntimeError(f'Could not get terminal size:\n{e}') from e  # why must it be 1 space over 😭
+    (only used to initialize `Terminal`, deleted afterwards)
+    """
+    try:
+        from os import get_terminal_size
 
+        width = get_terminal_size().columns
+        width -= width % 2 # make even
 
-    SIZE: int
-    """Terminal width in columns, adjusted to be even"""
+    except Exception as e:
+        raise RuntimeError(f'Could not get terminal size:\n{e}') from e  # why must it be 1 space over 😭
 
-    LEFT_PADDING: str
-    """Spaces to center 120 char content in terminal"""
+    if width < Terminal.MIN_TERM_WIDTH:
+        raise RuntimeError(
+            f'Terminal width too small for proper display: '
+            f'got {width}, need at least {Terminal.MIN_TERM_WIDTH}'
+        )
+    return width
 
 # initialize SIZE and LEFT_PADDING
-Terminal.SIZE = Terminal._get_term_width()
-Terminal._validate_term_width(Terminal.SIZE)
+Terminal.SIZE = _get_term_width()
 Terminal.LEFT_PADDING = ' ' * ((Terminal.SIZE - Terminal.MIN_TERM_WIDTH) // 2)
+del _get_term_width
+
+# module level snapshots (for direct import on hot paths)
+SIZE = Terminal.SIZE
+"""Snapshot of `Terminal.SIZE`"""
+LEFT_PADDING = Terminal.LEFT_PADDING
+"""Snapshot of `Terminal.LEFT_PADDING`"""
+MIN_TERM_WIDTH = Terminal.MIN_TERM_WIDTH
+"""Snapshot of `Terminal.MIN_TERM_WIDTH`"""
 
 
 class Load:
@@ -277,7 +292,7 @@ class Load:
     """Full name of RAISA"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _LoginProfile:
     """Dataclass for login display profiles"""
     Auth_Type: str
@@ -327,12 +342,12 @@ class Logins:
         )
     """Display profile for The Administrator"""
 
-    PROFILES: dict[str, _LoginProfile] = {
+    PROFILES: MappingProxyType[str, _LoginProfile] = MappingProxyType({
         'O5 Council Member': _O5_COUNCIL_MEMBER,
         'Site Director': _SITE_DIRECTOR,
         'Administrator': _ADMINISTRATOR
-    }
-    """Mapping of user titles to login display profiles"""
+    })
+    """Mapping of user titles to login display profiles (read-only)"""
 
 class FancyLogin:
     """
@@ -348,21 +363,25 @@ class FancyLogin:
     - TB_LINE
     - L_R
     - SEP
+    - LINE
     """
     _BORDER_WIDTH = 4 # left/right border width ('////')
 
     CONTENT_WIDTH = Terminal.MIN_TERM_WIDTH - _BORDER_WIDTH * 2
     """Width of text area inside fancy login box"""
 
-    TB_LINE = '/' * Terminal.MIN_TERM_WIDTH
+    TB_LINE = sys.intern('/' * Terminal.MIN_TERM_WIDTH)
     """Top/bottom line for fancy login box"""
 
-    L_R = '/' * _BORDER_WIDTH
+    L_R = sys.intern('/' * _BORDER_WIDTH)
     """Left/right border for fancy login box"""
 
-    SEP = f'{L_R}{' ' * CONTENT_WIDTH}{L_R}'
+    SEP = sys.intern(f'{L_R}{' ' * CONTENT_WIDTH}{L_R}')
     """Separator line for fancy login box"""
 
+    LINE = f'{L_R}{{:^{CONTENT_WIDTH}}}{L_R}'
+    """`str.format` template for a centered line inside the fancy login box"""
+
 
 class AccessMessages:
     """
@@ -435,7 +454,7 @@ class CreateMessages:
 
     PERSISTS = 'CONTACT YOUR SITE NETWORK ADMINISTRATOR IF ISSUES PERSIST'
     """Persistent issue message for file creation errors"""
-    TRY_AGAIN = ['PLEASE TRY AGAIN', PERSISTS]
+    TRY_AGAIN = ('PLEASE TRY AGAIN', PERSISTS)
     """Basic try again message for file creation errors"""
 
     # create_f()
@@ -14,13 +14,16 @@ Contains
     - DatabaseConnectionError
     - DatabaseSessionError
 
+- Socket related exceptions
+    - MaxSizeLimitError
+    - MessageDecodeError
+
 - General exceptions
-    - FieldError
-    - ArgumentError
+    - field_error (alias: FieldError)
+    - arg_error (alias: ArgumentError)
 """
 
 from typing import Any
-from humanize import naturalsize as hsize
 
 # maybe useful later ¯\_(ツ)_/¯
 '''
@@ -164,6 +167,9 @@ class MaxSizeLimitError(Exception):
                  max_size: int,
                  use_data: bool = True
                 ):
+        # only needed when raised, so import lazily
+        from humanize import naturalsize as hsize
+
         label = 'Data' if use_data else 'Message'
         super().__init__(
             f'{label} size ({hsize(data_size)}) exceeds'
@@ -189,22 +195,6 @@ class MessageDecodeError(Exception):
 
 # === General exceptions ===
 
-def _gen_error_str(
-                   invalid: str,
-                   value: Any,
-                   expected: str
-                  ) -> str:
-    """
-    Helper to format error strings consistently
-
-    Returns
-    -------
-    str
-        f'Invalid {invalid}: {value!r} (expected {expected})'
-    """
-    return f'Invalid {invalid}: {value!r} (expected {expected})'
-
-
 def field_error(
                 field: str,
                 field_val: Any,
@@ -226,9 +216,9 @@ def field_error(
     -------------
         >>> f'Invalid {field}: {field_val!r} (expected {expected})'
     """
-    return ValueError(_gen_error_str(
-                        field, field_val, expected
-                      ))
+    return ValueError(
+        f'Invalid {field}: {field_val!r} (expected {expected})'
+    )
 
 def arg_error(
               arg_name: str,
@@ -250,14 +240,18 @@ def arg_error(
 
     Error Message
     -------------
-        >>> f'''Invalid {arg_name} type: {type(arg_val).__name__}
-            (expected {expected_type.__name__})'''
+        >>> f'''Invalid type of {arg_name}: {type(arg_val).__name__!r}
+            (expected {expected_type.__name__!r})'''
     """
-    return TypeError(_gen_error_str(
-                        f'type of {arg_name}',
-                        type(arg_val).__name__,
-                        f'{expected_type.__name__!r}'
-                      ))
+    return TypeError(
+        f'Invalid type of {arg_name}: {type(arg_val).__name__!r}'
+        f' (expected {expected_type.__name__!r})'
+    )
+
+
+# older names, kept for backwards compatibility
+FieldError = field_error
+ArgumentError = arg_error
 
 
 __all__ = [
@@ -277,4 +271,6 @@ __all__ = [
            # General exceptions
            'field_error',
            'arg_error',
+           'FieldError',
+           'ArgumentError',
 ]
@@ -7,13 +7,15 @@ Contains
 - Server
 """
 
-from struct import calcsize
-from typing import Literal
+from struct import Struct
+from types import MappingProxyType
+from typing import Literal, Mapping, final
 
 from ..sql.schema import MainModels
 
 # === Constants ===
 
+@final
 class Socket:
     """
     Socket configuration constants
@@ -40,14 +42,22 @@ class Socket:
     - RCV_S
     - MAX_MSG_S
 
+    - SO_RCVBUF
+    - SO_SNDBUF
+    - TCP_NODELAY
+
     - S_TYPE
     - HEADER_S
+    - pack_header
+    - unpack_header
 
     - TEST_MSG
     - ACK_MSG
     - TEST_S
     """
 
+    __slots__ = ()
+
     DEF_TIMEOUT = 60
     """Default socket timeout in seconds"""
     TMP_TIMEOUT = 2
@@ -60,15 +70,33 @@ class Socket:
     ADDR = (HOST, PORT)
     """Server address tuple"""
 
-    RCV_S = 1024 * 4
-    """Receive buffer size in bytes (4 KB)"""
+    RCV_S = 1024 * 64
+    """Receive chunk size in bytes (64 KB)"""
     MAX_MSG_S = (1024 ** 2) * 50
     """Maximum message size in bytes (50 MB)"""
 
+    SO_RCVBUF = 1024 ** 2 * 4
+    """
+    Kernel receive buffer size in bytes (4 MB)
+
+    Linux caps this at `net.core.rmem_max` (& doubles it for bookkeeping),
+    so raise that sysctl too if the full size is needed
+    """
+    SO_SNDBUF = 1024 ** 2 * 4
+    """Kernel send buffer size in bytes (4 MB, capped by `net.core.wmem_max`)"""
+    TCP_NODELAY = True
+    """Whether to disable Nagle's algorithm (no batching delay on small sends)"""
+
     S_TYPE = '!I'
     """Size type for packing/unpacking message size with struct"""
-    HEADER_S = calcsize(S_TYPE)
+    _S_STRUCT = Struct(S_TYPE)
+    """Precompiled struct for `S_TYPE` (skips format parsing per call)"""
+    HEADER_S = _S_STRUCT.size
     """Header size in bytes (size of packed size type)"""
+    pack_header = _S_STRUCT.pack
+    """Packs a message size into a header: `pack_header(size) -> bytes`"""
+    unpack_header = _S_STRUCT.unpack
+    """Unpacks a header: `unpack_header(header) -> (size,)`"""
 
     TEST_MSG = b'\x01\x02\x03\x04'
     """Test message for connection verification"""
@@ -78,6 +106,7 @@ class Socket:
     """Size of test messages in bytes"""
 
 
+@final
 class Server:
     """
     Server configuration constants
@@ -89,26 +118,94 @@ class Server:
     Contains
     -------
     - DEBUG
+    - THREAD_STACK_S
+    - MAX_CLIENTS
+    - LISTEN_BACKLOG
+    - CLIENT_TIMEOUT
+    - READ_WORKERS
+    - PARALLEL_READ_MIN
+    - FD_CACHE_S
+    - ACCESS_CACHE_S
+    - ACCESS_CACHE_TTL
+    - AUTH_CACHE_S
+    - AUTH_CACHE_TTL
     - VALID_F_TYPES
+    - VALID_F_TYPES_SET
     """
 
+    __slots__ = ()
+
     DEBUG = False
     """Enable/disable debug messages"""
 
-    VALID_F_TYPES: dict[
+    THREAD_STACK_S = 1024 ** 2
+    """
+    Stack size in bytes for client handler threads (1 MB)
+
+    Handlers don't recurse deeply, so the platform default (8 MB on linux)
+    mostly reserves address space per worker
+    """
+
+    MAX_CLIENTS = 128
+    """
+    Max client requests handled at once (size of the handler thread pool)
+
+    Idle connected clients don't count, they only hold a socket
+    """
+    LISTEN_BACKLOG = 512
+    """Pending connections the OS queues while waiting on `accept()`"""
+    CLIENT_TIMEOUT = 30
+    """
+    Seconds a worker waits on a client mid request before dropping it
+
+    Idle clients between requests wait on the selector, not a worker,
+    so this only bounds stalled (eg. partial) messages
+    """
+
+    READ_WORKERS = 8
+    """Max threads reading a directory's files concurrently (`read_files()`)"""
+    PARALLEL_READ_MIN = 8
+    """
+    Min files in a directory before `read_files()` reads them concurrently
+
+    Below this, thread handoff costs more than the reads on a local disk
+    """
+
+    FD_CACHE_S = 256
+    """
+    Max files `read_file()` keeps open (least recently used are closed)
+
+    Keep well under the process fd limit (`ulimit -n`), clients need fds too
+    """
+    ACCESS_CACHE_S = 4096
+    """Max files `access()` keeps loaded (least recently used are dropped)"""
+    ACCESS_CACHE_TTL = 300
+    """
+    Seconds `access()` keeps a loaded file before reloading it from the db
+    (file changes on disk are still picked up on the next access)
+    """
+
+    AUTH_CACHE_S = 10_000
+    """Max successful logins `auth_usr()` remembers"""
+    AUTH_CACHE_TTL = 60
+    """Seconds a successful login is remembered (skipping the password hash)"""
+
+    VALID_F_TYPES: Mapping[
         Literal['SCP', 'MTF', 'SITE', 'USER'],
         type[MainModels.SCP] | type[MainModels.MTF] |
         type[MainModels.Site] | type[MainModels.User]
-    ] = {
+    ] = MappingProxyType({
         'SCP': MainModels.SCP,
         "MTF": MainModels.MTF,
         "SITE": MainModels.Site,
         "USER": MainModels.User,
-    }
+    })
     """
     Valid field types and their associated deepwell table model
-    for various operations
+    for various operations (read-only)
     """
+    VALID_F_TYPES_SET = frozenset(VALID_F_TYPES)
+    """Valid field types (for membership checks)"""
 
 
 
@@ -9,10 +9,16 @@ Contains
     - DEEPWELL_DIR
     - DB_PATH
     - DB_URL
+    - DB_URL_RO
 
 - SQLAlchemy Config
-    - POOL_CONFIG
+    - WRITER_POOL_CONFIG
+    - READER_POOL_CONFIG
     - SQLITE_CONFIG
+    - SQLITE_PRAGMAS
+    - SQLITE_RO_PRAGMAS
+    - configure_sqlite_connection()
+    - configure_sqlite_reader()
 
 - Other Config
     - EXPUNGED
@@ -23,38 +29,60 @@ Notes
 - Made primarily by Github Copilot
 """
 
+import os
 from pathlib import Path
+from typing import Any, final
 
 
 
 # === Paths ===
-PROJECT_ROOT = Path(__file__).parents[2].resolve()
+# built as strs (no `resolve()` syscalls at import), wrapped in Paths after
+_ROOT_STR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DEEPWELL_STR = os.path.join(_ROOT_STR, 'deepwell')
+_DB_STR = os.path.join(_DEEPWELL_STR, 'SCiPnet.db')
+
+PROJECT_ROOT = Path(_ROOT_STR)
 """Path to project root (`CS50xFP/`)"""
-DEEPWELL_DIR = PROJECT_ROOT / 'deepwell'
+DEEPWELL_DIR = Path(_DEEPWELL_STR)
 """Path to the `deepwell/` directory"""
-DB_PATH = DEEPWELL_DIR / 'SCiPnet.db'
+DB_PATH = Path(_DB_STR)
 """Path to the SQLite database"""
 
-DB_URL = f'sqlite:///{DB_PATH}'
+DB_URL = f'sqlite:///{_DB_STR}'
 """URL to connect to the database"""
+DB_URL_RO = f'sqlite:///file:{_DB_STR}?mode=ro&uri=true'
+"""URL to connect to the database read-only (`uri=true` opens it as a URI)"""
 
 
 
 # === SQLAlchemy Config ===
-_DEBUG_MODE = False
-"""Whether to run the database in debug mode (echo SQL queries)"""
+_DEBUG_MODE = os.environ.get('SCIPNET_SQL_ECHO', '0') == '1'
+"""
+Whether to run the database in debug mode (echo SQL queries)
+
+Set `SCIPNET_SQL_ECHO=1` to enable (development only, logs every statement)
+"""
 
-POOL_CONFIG = {
-    'pool_size': 5,        # num of permanent db conns
-    'max_overflow': 10,    # max num of additional db conns
+WRITER_POOL_CONFIG = {
+    'pool_size': 1,        # SQLite allows a single writer at a time
+    'max_overflow': 0,     # so writers queue on checkout, not on SQLITE_BUSY
     'pool_timeout': 30,    # seconds to wait for an available conn before throwing an error
-    'pool_recycle': 3600,  # seconds to recycle conns
-    'pool_pre_ping': True  # test connections before using them
+    'pool_recycle': 1800,  # seconds to recycle conns
+    'pool_pre_ping': False # a local file can't go stale (pre-ping only pays off for server dbs)
 }
-"""Connection pool configuration"""
+"""Connection pool configuration for writes"""
+
+READER_POOL_CONFIG = {
+    'pool_size': 25,       # num of permanent db conns (~1 per active client thread)
+    'max_overflow': 25,    # max num of additional db conns (bursts of clients)
+    'pool_timeout': 30,    # seconds to wait for an available conn before throwing an error
+    'pool_recycle': 1800,  # seconds to recycle conns
+    'pool_pre_ping': False # a local file can't go stale (pre-ping only pays off for server dbs)
+}
+"""Connection pool configuration for reads (`DB_URL_RO`, never blocks the writer in WAL)"""
 
 SQLITE_CONFIG = {
-    'isolation_level': 'SERIALIZABLE',     #
+    'isolation_level': 'SERIALIZABLE',     # only level SQLite supports (besides AUTOCOMMIT)
     'echo': _DEBUG_MODE,                   # log SQL queries in debug mode
     'connect_args': {
         'timeout': 30,                    # seconds to wait for transaction completion
@@ -63,6 +91,59 @@ SQLITE_CONFIG = {
 }
 """SQLite specific configuration"""
 
+SQLITE_PRAGMAS = (
+    ('journal_mode', 'WAL'),     # readers don't block the writer (& vice versa)
+    ('synchronous', 'NORMAL'),   # fsync at checkpoints only (safe with WAL)
+    ('cache_size', -20000),      # ~20MB page cache (negative = KiB)
+    ('temp_store', 'MEMORY'),    # keep temp tables/indices in memory
+    ('busy_timeout', 5000),      # ms to wait on a locked db before SQLITE_BUSY
+    ('foreign_keys', 'ON'),      # enforce FK constraints
+)
+"""PRAGMAs applied to every new SQLite connection"""
+
+SQLITE_RO_PRAGMAS = tuple(p for p in SQLITE_PRAGMAS if p[0] != 'journal_mode')
+"""PRAGMAs applied to every new read-only connection (can't set the journal mode)"""
+
+
+def _apply_pragmas(dbapi_conn: Any, pragmas: tuple[tuple[str, Any], ...]) -> None:
+    """Runs `PRAGMA name=value` for each of `pragmas` on a DBAPI connection"""
+    cur = dbapi_conn.cursor()
+
+    try:
+        for pragma, value in pragmas:
+            cur.execute(f'PRAGMA {pragma}={value}')
+    finally:
+        cur.close()
+
+
+def configure_sqlite_connection(dbapi_conn: Any, _: Any) -> None:
+    """
+    Applies `SQLITE_PRAGMAS` to a new DBAPI connection
+
+    Parameters
+    ----------
+    dbapi_conn : sqlite3.Connection
+        raw DBAPI connection
+    _ : ConnectionRecord
+        SQLAlchemy pool record (unused)
+
+    Notes
+    -----
+    - For `event.listen(engine, 'connect', configure_sqlite_connection)`
+    """
+    _apply_pragmas(dbapi_conn, SQLITE_PRAGMAS)
+
+
+def configure_sqlite_reader(dbapi_conn: Any, _: Any) -> None:
+    """
+    Applies `SQLITE_RO_PRAGMAS` to a new read-only DBAPI connection
+
+    Notes
+    -----
+    - For `event.listen(read_engine, 'connect', configure_sqlite_reader)`
+    """
+    _apply_pragmas(dbapi_conn, SQLITE_RO_PRAGMAS)
+
 
 
 # === Other Config ===
@@ -76,15 +157,25 @@ NONE_STR = 'None'
 
 # namespaces
 
+@final
 class Config:
-    POOL = POOL_CONFIG
+    __slots__ = ()
+
+    WRITER_POOL = WRITER_POOL_CONFIG
+    READER_POOL = READER_POOL_CONFIG
     SQLITE = SQLITE_CONFIG
+    SQLITE_PRAGMAS = SQLITE_PRAGMAS
+    SQLITE_RO_PRAGMAS = SQLITE_RO_PRAGMAS
 
+@final
 class Paths:
+    __slots__ = ()
+
     PROJECT_ROOT = PROJECT_ROOT
     DEEPWELL_DIR = DEEPWELL_DIR
     DB_PATH = DB_PATH
     DB_URL = DB_URL
+    DB_URL_RO = DB_URL_RO
 
 
 __all__ = [
@@ -93,11 +184,17 @@ __all__ = [
            'DEEPWELL_DIR',
            'DB_PATH',
            'DB_URL',
+           'DB_URL_RO',
 
            # SQLAlchemy Config
            '_DEBUG_MODE',
-           'POOL_CONFIG',
+           'WRITER_POOL_CONFIG',
+           'READER_POOL_CONFIG',
            'SQLITE_CONFIG',
+           'SQLITE_PRAGMAS',
+           'SQLITE_RO_PRAGMAS',
+           'configure_sqlite_connection',
+           'configure_sqlite_reader',
 
            # Namespaces
            'Config',
@@ -11,7 +11,8 @@ from types import UnionType
 from typing import Any, Literal, cast, get_type_hints, TypeVar, Mapping, \
                    get_args, get_origin, is_typeddict
 from enum import Enum
-from re import fullmatch
+from functools import lru_cache
+import re
 from ipaddress import ip_address
 
 from .exceptions import arg_error, field_error, ColumnNotFoundError
@@ -23,7 +24,8 @@ from ..socket.protocol import MESSAGE_KEYS, MessageTypes, Message, \
 
 E = TypeVar('E', bound=Enum)
 M = TypeVar('M', bound=Message)
-HEX_REGEX = r'^#[0-9a-fA-F]{6}$'
+_HEX_RE = re.compile(r'#[0-9a-fA-F]{6}\Z')
+"""Hex colour code pattern (anchored at the end so `.match` is a full match)"""
 
 
 
@@ -62,6 +64,32 @@ def _check_type(val: Any, expected: type) -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
+def _get_hints(
+               format: type
+              ) -> tuple[tuple[tuple[str, Any], ...], frozenset[str]]:
+    """
+    Helper to get (cached) type hints for a TypedDict
+
+    Parameters
+    ----------
+    format : type
+        The TypedDict class
+
+    Returns
+    -------
+    tuple[tuple[tuple[str, Any], ...], frozenset[str]]
+        (key, expected type) pairs & the set of expected keys
+
+    Notes
+    -----
+    - `get_type_hints` walks the MRO and resolves annotations,
+      so it's only done once per class
+    """
+    hints = tuple(get_type_hints(format).items())
+    return hints, frozenset(key for key, _ in hints)
+
+
 # === General Funcs ===
 
 def validate_field(
@@ -173,10 +201,21 @@ def validate_enum(
     -----
     - If `field` is not a non-empty str, I will gut you like a fish
     - If `enum_type` is not an Enum, I will gut you like a fish
+    - Valid values are looked up directly in `_value2member_map_`
     """
     if isinstance(field_val, enum_type):
         return field_val
 
+    # fast path: direct value -> member lookup (skips EnumType.__call__)
+    try:
+        member = enum_type._value2member_map_.get(field_val)
+    except TypeError:  # unhashable
+        member = None
+
+    if member is not None:
+        return member
+
+    # slow path (`_missing_` hooks, unhashable values) & error handling
     try:
         return enum_type(field_val)
     except ValueError as e:
@@ -210,7 +249,8 @@ def validate_str(field: str, field_val: str) -> None:
     -----
     - If `field` is not a non-empty str, I will gut you like a fish
     """
-    validate_field(field, field_val, str)
+    if not isinstance(field_val, str):  # inlined validate_field (hot path)
+        raise arg_error(field, field_val, str)
 
     if not field_val or field_val.isspace():
         raise field_error(field, field_val, 'non-empty str')
@@ -236,10 +276,12 @@ def validate_hex(field: str, field_val: str) -> None:
     Notes
     -----
     - If `field` is not a non-empty str, I will gut you like a fish
+    - The compiled regex is the fastest check available in pure python
+      (`str.strip(hexdigits)` and int-packing/SWAR variants measured slower)
     """
     validate_str(field, field_val)
 
-    if not fullmatch(HEX_REGEX, field_val):
+    if _HEX_RE.match(field_val) is None:
         raise field_error(
             field, field_val, 'valid hex colour code (eg. #1A2B3C)'
         )
@@ -304,18 +346,23 @@ def validate_int(
         If `field_val` is not an int
     ValueError
         - If `positive` is True and `field_val` is not positive
-        - If `non_negative` is True and `field_val` is zero
+        - If `non_negative` is True and `field_val` is negative
 
     Notes
     -----
     - If `field` is not a non-empty str, I will gut you like a fish
     - If `positive` and `non_negative` are not bools, I will gut you like a fish
     - If anything but `field_val` is invalid, I will gut you like a fish
+    - bools are rejected (`type(field_val) is int`)
+    - `positive` takes precedence over `non_negative`
     """
-    validate_field(field, field_val, int)
+    if type(field_val) is not int:
+        raise arg_error(field, field_val, int)
+
+    if positive:
+        if field_val < 1:
+            raise field_error(field, field_val, 'positive int (> 0)')
 
-    if positive and field_val <= 0:
-        raise field_error(field, field_val, 'positive int (> 0)')
     elif non_negative and field_val < 0:
         raise field_error(field, field_val, 'non-negative int (>= 0)')
 
@@ -343,36 +390,42 @@ def validate_dict(
     TypeError
         - If `field_val` is not a dict
         - If all keys in `field_val` are not str
+        - If a value in `field_val` doesn't match its `format` type
+    ValueError
+        If the keys of `field_val` don't match `format`
 
     Notes
     -----
     - If `field` is not a non-empty str, I will gut you like a fish
+    - With `format`, keys are only checked against the TypedDict's keys
+      (a non-str key can never match, so it fails there instead)
     """
-    validate_field(field, field_val, dict)
-
-    val_keys = list(field_val.keys())
+    if not isinstance(field_val, dict):  # inlined validate_field (hot path)
+        raise arg_error(field, field_val, dict)
 
-    for key in val_keys:
-        validate_field(f'{field} key', key, str)
+    if not format:
+        if not all(isinstance(key, str) for key in field_val):
+            bad_key = next(key for key in field_val if not isinstance(key, str))
+            raise arg_error(f'{field} key', bad_key, str)
+        return
 
-    if format:
-        # Get type hints from TypedDict
-        expected_annotations = get_type_hints(format)
-        expected_keys = list(expected_annotations.keys())
+    # Get (cached) type hints from TypedDict
+    expected_hints, expected_keys = _get_hints(format)
 
-        if set(val_keys) != set(expected_keys):
-            raise field_error(
-                f'{field} keys', val_keys,
-                f'keys to match {expected_keys}'
-            )
+    # matching the (str) expected keys also covers the str key check
+    if expected_keys != field_val.keys():
+        raise field_error(
+            f'{field} keys', list(field_val),
+            f'keys to match {[key for key, _ in expected_hints]}'
+        )
 
-        # validate value types
-        for key, expected_type in expected_annotations.items():
-            validate_field(
-                f'{field}[{key!r}]',
-                field_val[key],
-                expected_type
-            )
+    # validate value types
+    for key, expected_type in expected_hints:
+        validate_field(
+            f'{field}[{key!r}]',
+            field_val[key],
+            expected_type
+        )
 
 
 def validate_msg(
@@ -405,11 +458,13 @@ def validate_msg(
     -----
     - If `expected_type` is not a subclass of Message, I will gut you like a fish
     """
-    validate_dict('message', msg)
+    if not isinstance(msg, dict):
+        raise arg_error('message', msg, dict)
 
-    if set(msg.keys()) != MESSAGE_KEYS:
+    # matching MESSAGE_KEYS also covers the str key check
+    if msg.keys() != MESSAGE_KEYS:
         raise field_error(
-            'message keys', list(msg.keys()),
+            'message keys', list(msg),
             f'keys to match {list(MESSAGE_KEYS)}'
         )
 
@@ -457,9 +512,14 @@ def validate_data(data: Any) -> None:
     ------
     ValueError
         If `data` is None or empty
+
+    Notes
+    -----
+    - No-op under `python -O` (only catches programmer errors)
     """
-    if data is None or len(data) == 0:
-        raise ValueError('No data provided')
+    if __debug__:
+        if data is None or len(data) == 0:
+            raise ValueError('No data provided')
 
 def validate_conn(conn: socket.socket) -> None:
     """
@@ -474,14 +534,23 @@ def validate_conn(conn: socket.socket) -> None:
     ------
     TypeError
         If `conn` is not a socket.socket instance
+
+    Notes
+    -----
+    - No-op under `python -O` (only catches programmer errors)
     """
-    validate_field('conn', conn, socket.socket)
+    if __debug__:
+        if not isinstance(conn, socket.socket):
+            raise arg_error('conn', conn, socket.socket)
 
 
 
 # === Server Funcs ===
 
-def validate_f_type(f_type: str) -> None:
+def validate_f_type(
+                    f_type: str,
+                    _valid: frozenset[str] = Server.VALID_F_TYPES_SET
+                   ) -> None:
     """
     Validates `f_type` is in `Server.VALID_F_TYPES`
 
@@ -494,8 +563,12 @@ def validate_f_type(f_type: str) -> None:
     ------
     ValueError
         If `f_type` is not in `Server.VALID_F_TYPES`
+
+    Notes
+    -----
+    - `_valid` is bound at definition to skip the global & attr lookups
     """
-    if f_type not in Server.VALID_F_TYPES:
+    if f_type not in _valid:
         raise field_error(
             'f_type', f_type,
             f'one of {list(Server.VALID_F_TYPES.keys())}'
@@ -532,6 +605,14 @@ def validate_model_field(
 
 
 
+# === Import-time Setup ===
+
+# resolve every message format's type hints now,
+# so `validate_msg` only does cached lookups per message
+for _format in (*format_map.values(), *access_granted_format_map.values()):
+    _get_hints(_format)
+del _format
+
 
 
 # === Exports ===
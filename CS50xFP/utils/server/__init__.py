@@ -5,13 +5,17 @@ Contains
 --------
 - handle_usr
 - auth_usr
+- invalidate_auth
 - access
+- clear_access_cache
 """
 
-from .basic import auth_usr
-from .actions import access
+from .basic import auth_usr, invalidate_auth
+from .actions import access, clear_access_cache
 
 __all__ = [
     'auth_usr',
-    'access'
+    'invalidate_auth',
+    'access',
+    'clear_access_cache',
 ]
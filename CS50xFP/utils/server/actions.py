@@ -4,29 +4,353 @@ Handlers for server response to actions
 Contains
 --------
 - access(f_type: str, f_id: int, user: PydanticModels.User, user_ip: str) -> Message
+- clear_access_cache() -> None
 """
 
-from typing import Literal
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from time import monotonic_ns
+from sqlalchemy import null, select
+from sqlalchemy.orm import joinedload, selectinload
+from typing import Any, Callable, Literal
 
-from .helpers import read_file, read_files, log_access
+from .helpers import read_files, list_files, log_access
 from ..general.server_config import Server
 from ..general.display_config import Styles
-from ..general.sql_config import DEEPWELL_DIR
+from ..general.sql_config import DEEPWELL_DIR, EXPUNGED
 from ..general.validation import validate_int, validate_ip, validate_field, \
                                  validate_f_type
 
-from ..sql.queries import get_model, get_field, db_session
+from ..sql.queries import get_model, get_field
+from ..sql.core import db_read_session
 from ..sql.transformers import Models as PydanticModels, orm_to_pydantic
-from ..sql.schema import HelperModels as ORMHelperModels
-from ..socket.protocol import Message, AccessGrantedSCPData, \
-                              AccessGrantedMTFData, AccessGrantedSiteData, \
-                              AccessGrantedUserData
+from ..sql.schema import HelperModels as ORMHelperModels, \
+                         MainModels as ORMModels
+from ..socket.protocol import Message, AccessGrantedData, \
+                              AccessGrantedSCPData, AccessGrantedMTFData, \
+                              AccessGrantedSiteData, AccessGrantedUserData
 from ..socket import Msg
+from ..socket.helpers import EncodedMessage
 from ..general.exceptions import RecordNotFoundError
 
 
 
 
+# === Helpers ===
+
+_USER_REF = (
+    joinedload(ORMModels.User.title),
+    joinedload(ORMModels.User.clearance_lvl),
+)
+"""Relationships read by `UserRef` / `User` (pydantic)"""
+
+_SCP_REF = (
+    joinedload(ORMModels.SCP.clearance_lvl),
+    joinedload(ORMModels.SCP.containment_class),
+    joinedload(ORMModels.SCP.mtf),
+)
+"""Relationships read by `SCPRef` (pydantic)"""
+
+_LOAD_OPTIONS = {
+    ORMModels.SCP: (
+        *_SCP_REF,
+        joinedload(ORMModels.SCP.secondary_class),
+        joinedload(ORMModels.SCP.disruption_class),
+        joinedload(ORMModels.SCP.risk_class),
+    ),
+    ORMModels.MTF: (
+        joinedload(ORMModels.MTF.leader).options(*_USER_REF),
+        joinedload(ORMModels.MTF.site),
+        selectinload(ORMModels.MTF.scps).options(*_SCP_REF),
+        selectinload(ORMModels.MTF.members).options(*_USER_REF),
+    ),
+    ORMModels.Site: (
+        joinedload(ORMModels.Site.director).options(*_USER_REF),
+        selectinload(ORMModels.Site.staff).options(*_USER_REF),
+        selectinload(ORMModels.Site.scps).options(*_SCP_REF),
+        joinedload(ORMModels.Site.mtfs),  # few rows: join, no extra query
+    ),
+    ORMModels.User: _USER_REF,
+}
+"""
+Eager loads per model, so `orm_to_pydantic` doesn't lazy load
+each relationship with its own query
+"""
+
+
+# hot path aliases (one global lookup instead of an attribute walk per use)
+_VALID_F_TYPES = Server.VALID_F_TYPES
+_CLEAR_LVL = Styles.CLEAR_LVL
+_access_granted = Msg.access_granted
+_access_redacted = Msg.access_redacted
+_access_expunged = Msg.access_expunged
+_access_type_fail = Msg.access_type_fail
+
+
+_TYPE_ROOTS = {
+    f_type: os.path.join(os.path.realpath(DEEPWELL_DIR), f'{f_type.lower()}s')
+    for f_type in _VALID_F_TYPES
+}
+"""
+Resolved directory of each file type's files (resolved once at import)
+
+`f_id` is a validated int, so joining it on can't escape the root
+"""
+
+
+@lru_cache(maxsize=8192)
+def _f_path(f_type: str, f_id: int) -> str:
+    """Directory of a file's files (a file's path never changes)"""
+    return os.path.join(_TYPE_ROOTS[f_type], str(f_id))
+
+
+@lru_cache(maxsize=None)
+def _clearance_name(clearance_id: int) -> str:
+    """
+    Cached `ClearanceLvl` name lookup
+
+    Clearance levels are fixed reference data,
+    so each is only queried once per process
+    """
+    return get_field(ORMHelperModels.ClearanceLvl, 'name', 'id', clearance_id)
+
+
+_ROW_CHECK: dict[type, tuple[Any, Any]] = {
+    ORMModels.SCP: (ORMModels.SCP.id, ORMModels.SCP.clearance_lvl_id),
+    ORMModels.User: (ORMModels.User.id, ORMModels.User.clearance_lvl_id),
+    ORMModels.MTF: (ORMModels.MTF.id, null()),
+    ORMModels.Site: (ORMModels.Site.id, null()),
+}
+"""
+Columns `access()` checks a row by: `(id, required clearance id)`
+(no clearance column is NULL)
+"""
+
+_clearance_index: dict[tuple[str, int], tuple[int, int]] = {}
+"""
+`(f_type, f_id)` -> `(required clearance id, recheck ns)` for SCPs & Users
+
+Lets `access()` reject a user below a file's clearance before any file or
+db work (trusted for `Server.ACCESS_CACHE_TTL`, like the access cache).
+Written under `_access_cache_lock`
+"""
+
+
+_access_cache: OrderedDict[tuple[str, int], list[Any]] = OrderedDict()
+"""
+LRU of `(f_type, f_id)` ->
+`[files stamp, f_model, granted_msg | None, expiry ns, watched paths]`
+
+An entry is rebuilt when its files' stamp changes, and reloaded from the
+db (related rows included) once `expiry ns` passes (`Server.ACCESS_CACHE_TTL`)
+"""
+_access_cache_lock = Lock()
+
+
+_FILE_NAMES = {
+    'SCP': ('desc.md', 'cps.md'),
+    'MTF': ('mission.md',),
+    'SITE': ('loc.md', 'desc.md', 'dossier.md'),
+    'USER': (),
+}
+"""Files each file type's AccessGranted data reads (besides SCP addenda)"""
+
+
+def _watched_paths(f_type: str, f_path: str) -> tuple[str, ...]:
+    """
+    Paths whose changes make a cached file stale: its directory, the files
+    its data reads, and for SCPs the `addenda` directory & each addendum
+
+    The directories catch files being added, removed or replaced,
+    the files catch in place edits (which don't touch a directory's mtime)
+    """
+    join = os.path.join
+    paths = [f_path, *(join(f_path, name) for name in _FILE_NAMES[f_type])]
+
+    if f_type == 'SCP':
+        addenda = join(f_path, 'addenda')
+        paths.append(addenda)
+        paths.extend(join(addenda, name) for name in list_files(addenda))
+
+    return tuple(paths)
+
+
+def _files_stamp(paths: tuple[str, ...]) -> tuple[int | None, ...]:
+    """Each of `paths`' mtime (ns), None for one that doesn't exist"""
+    stamp: list[int | None] = []
+    for path in paths:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def _cache_get(key: tuple[str, int]) -> list[Any] | None:
+    """Gets & marks `key` as recently used in the access cache"""
+    with _access_cache_lock:
+        entry = _access_cache.get(key)
+        if entry is not None:
+            _access_cache.move_to_end(key)
+        return entry
+
+
+def _cache_put(key: tuple[str, int], entry: list[Any]) -> None:
+    """Stores `entry` under `key`, evicting the least recently used"""
+    with _access_cache_lock:
+        _access_cache[key] = entry
+        _access_cache.move_to_end(key)
+        if len(_access_cache) > Server.ACCESS_CACHE_S:
+            _access_cache.popitem(last=False)
+
+
+def _index_put(key: tuple[str, int], required: tuple[int, int]) -> None:
+    """Stores a file's required clearance in `_clearance_index`"""
+    with _access_cache_lock:
+        if len(_clearance_index) >= Server.ACCESS_CACHE_S:
+            _clearance_index.clear()  # one int per file to refill
+        _clearance_index[key] = required
+
+
+def clear_access_cache() -> None:
+    """
+    Drops all cached files
+
+    Call after writing to the deepwell so the next `access()` reloads
+    (otherwise db changes show once `Server.ACCESS_CACHE_TTL` passes)
+    """
+    with _access_cache_lock:
+        _access_cache.clear()
+        _clearance_index.clear()
+
+
+@lru_cache(maxsize=256)
+def _redacted_msg(
+                  user_clear: str,
+                  user_lvl: int,
+                  required: int
+                 ) -> EncodedMessage:
+    """
+    AccessRedacted for a user at clearance `user_lvl` (named `user_clear`)
+    below `required`, built & encoded once per pair, then resent as is
+    """
+    return EncodedMessage(_access_redacted(
+        user_clear,
+        _CLEAR_LVL[user_lvl],
+        _clearance_name(required),
+        _CLEAR_LVL[required],
+    ))
+
+
+@lru_cache(maxsize=1024)
+def _expunged_msg(f_type: str, f_id: int) -> EncodedMessage:
+    """AccessExpunged for a missing file, built & encoded once per file"""
+    return EncodedMessage(_access_expunged(f_type, f_id))
+
+
+def _deny_clearance(
+                    f_type: str,
+                    f_id: int,
+                    user: PydanticModels.User,
+                    user_ip: str,
+                    required: int
+                   ) -> Message:
+    """Logs & builds the response to a user below a file's `required` clearance"""
+    log_access(
+        user.id, user_ip, False,
+        f'Attempted access to {f_type} ID {f_id}'
+         ' with insufficient clearance'
+    )
+    return _redacted_msg(
+        user.display_clearance, user.clearance_lvl.id, required
+    )
+
+
+def _build_scp_data(
+                    f_model: PydanticModels.SCP,
+                    f_path: str
+                   ) -> AccessGrantedSCPData:
+    """AccessGranted data for a SCP (description, procedures & addenda)"""
+    # one read batch for all the SCP's files
+    addenda = list_files(os.path.join(f_path, 'addenda'))
+    addenda_paths = [f'addenda/{name}' for name in addenda]
+    # (addenda that vanish after the listing are dropped, not EXPUNGED)
+    files = read_files(f_path, ['desc.md', 'cps.md', *addenda_paths],
+                       skip_missing=True)
+
+    return {
+        'f_type': 'SCP',
+        'f_model': f_model.model_dump_json(),
+        'files': {
+            'desc': files.get('desc.md', EXPUNGED),
+            'cps': files.get('cps.md', EXPUNGED),
+            'addenda': {
+                name: files[path]
+                for name, path in zip(addenda, addenda_paths)
+                if path in files
+            },
+        },
+    }
+
+
+def _build_mtf_data(
+                    f_model: PydanticModels.MTF,
+                    f_path: str
+                   ) -> AccessGrantedMTFData:
+    """AccessGranted data for a MTF (mission)"""
+    files = read_files(f_path, ['mission.md'])
+    return {
+        'f_type': 'MTF',
+        'f_model': f_model.model_dump_json(),
+        'files': {
+            'mission': files['mission.md'],
+        },
+    }
+
+
+def _build_site_data(
+                     f_model: PydanticModels.Site,
+                     f_path: str
+                    ) -> AccessGrantedSiteData:
+    """AccessGranted data for a Site (location, description & dossier)"""
+    files = read_files(f_path, ['loc.md', 'desc.md', 'dossier.md'])
+    return {
+        'f_type': 'SITE',
+        'f_model': f_model.model_dump_json(),
+        'files': {
+            'loc': files['loc.md'],
+            'desc': files['desc.md'],
+            'dossier': files['dossier.md'],
+        },
+    }
+
+
+def _build_user_data(
+                     f_model: PydanticModels.User,
+                     f_path: str
+                    ) -> AccessGrantedUserData:
+    """AccessGranted data for a User (no files)"""
+    return {
+        'f_type': 'USER',
+        'f_model': f_model.model_dump_json(),
+        'files': {
+            # Users have no associated files
+        },
+    }
+
+
+_BUILDERS: dict[type, Callable[[Any, str], AccessGrantedData]] = {
+    PydanticModels.SCP: _build_scp_data,
+    PydanticModels.MTF: _build_mtf_data,
+    PydanticModels.Site: _build_site_data,
+    PydanticModels.User: _build_user_data,
+}
+"""AccessGranted data builder per (pydantic) file model"""
+
+
+
 # === Main Funcs ===
 
 
@@ -63,111 +387,105 @@ def access(
 
     # === get file data ===
 
-    f_model_class = Server.VALID_F_TYPES.get(f_type)
+    f_model_class = _VALID_F_TYPES.get(f_type)
 
     if not f_model_class:
         log_access(
             user.id, user_ip, False,
             f'Attempted access to invalid file type: {f_type}'
         )
-        return Msg.access_type_fail(f_type)
-
-    with db_session() as session:
-        f_data = session.get(f_model_class, f_id)
-        if not f_data:
-            log_access(
-                user.id, user_ip, False,
-                f'Attempted access to non-existent {f_type} ID {f_id}'
-            )
-            return Msg.access_expunged(f_type, f_id)
-
-        f_model = orm_to_pydantic(f_data)
+        return _access_type_fail(f_type)
+
+    key = (f_type, f_id)
+    now = monotonic_ns()
+
+    # known to be above the user's clearance, reject before any file or db work
+    required = _clearance_index.get(key)
+    if (
+        required is not None and required[1] > now
+        and user.clearance_lvl.id < required[0]
+    ):
+        return _deny_clearance(f_type, f_id, user, user_ip, required[0])
+
+    f_path = _f_path(f_type, f_id)
+    entry = _cache_get(key)
+
+    # expired: reload, related rows (members, staff, names...) may have changed
+    if entry is not None and entry[3] <= now:
+        entry = None
+
+    # not loaded, or files changed
+    if entry is None or entry[0] != _files_stamp(entry[4]):
+        expiry = now + Server.ACCESS_CACHE_TTL * 10**9
+
+        with db_read_session() as session:
+            # one indexed lookup: does the file exist & may the user see it
+            row = session.execute(
+                select(*_ROW_CHECK[f_model_class])
+                .where(f_model_class.id == f_id)
+            ).first()
+            if row is None:
+                log_access(
+                    user.id, user_ip, False,
+                    f'Attempted access to non-existent {f_type} ID {f_id}'
+                )
+                return _expunged_msg(f_type, f_id)
+
+            clearance_id = row[1]
+
+            if clearance_id is not None:
+                _index_put(key, (clearance_id, expiry))
+
+                # denied, don't load the file
+                if user.clearance_lvl.id < clearance_id:
+                    return _deny_clearance(
+                        f_type, f_id, user, user_ip, clearance_id
+                    )
+
+            # stamped before the files are read, so an edit made
+            # while reading shows up as a change next access
+            paths = _watched_paths(f_type, f_path)
+            stamp = _files_stamp(paths)
+
+            f_data = session.get(
+                                 f_model_class, f_id,
+                                 options=_LOAD_OPTIONS[f_model_class]
+                                )
+            entry = [stamp, orm_to_pydantic(f_data), None, expiry, paths]
+            _cache_put(key, entry)
+
+    f_model = entry[1]
+    f_cls = type(f_model)  # exact: `orm_to_pydantic` never returns subclasses
 
 
     # === Check clearance ===
 
-    if isinstance(
-        f_model,
-        (PydanticModels.SCP, PydanticModels.User)
+    if (
+        f_cls is PydanticModels.SCP or f_cls is PydanticModels.User
     ) and user.clearance_lvl.id < f_model.clearance_lvl.id:
-        log_access(
-            user.id, user_ip, False,
-            f'Attempted access to {f_type} ID {f_id}'
-             ' with insufficient clearance'
-        )
-        return Msg.access_redacted(
-            user.display_clearance,
-            Styles.CLEAR_LVL[user.clearance_lvl.id],
-            f_model.display_clearance,
-            Styles.CLEAR_LVL[f_model.clearance_lvl.id],
+        return _deny_clearance(
+            f_type, f_id, user, user_ip, f_model.clearance_lvl.id
         )
 
-    elif isinstance(
-        f_model, PydanticModels.Site
-    ) and (user.clearance_lvl.id < 3 and user.site_id != f_model.id):
+    elif f_cls is PydanticModels.Site and (
+        user.clearance_lvl.id < 3 and user.site_id != f_model.id
+    ):
         log_access(
             user.id, user_ip, False,
             f'Attempted access to Site {f_model.id} with'
                 ' insufficient clearance'
         )
-        return Msg.access_redacted(
-            user.display_clearance,
-            Styles.CLEAR_LVL[user.clearance_lvl.id],
-            get_field(ORMHelperModels.ClearanceLvl, 'name', 'id', 3),
-            Styles.CLEAR_LVL[3],
-        )
+        return _redacted_msg(user.display_clearance, user.clearance_lvl.id, 3)
 
     # MTF's are accessible to all authenticated users for now
 
 
     # === Gather file data ===
 
-    f_path = (DEEPWELL_DIR / f'{f_type.lower()}s' / f'{f_id}').resolve()
-
-
-    if isinstance(f_model, PydanticModels.SCP):
-        scp_data: AccessGrantedSCPData = {
-            'f_type': 'SCP',
-            'f_model': f_model.model_dump_json(),
-            'files': {
-                'desc': read_file(f_path / 'desc.md'),
-                'cps': read_file(f_path / 'cps.md'),
-                'addenda': read_files(f_path / 'addenda'),
-            },
-        }
-        result = Msg.access_granted(scp_data)
-
-    elif isinstance(f_model, PydanticModels.MTF):
-        mtf_data: AccessGrantedMTFData = {
-            'f_type': 'MTF',
-            'f_model': f_model.model_dump_json(),
-            'files': {
-                'mission': read_file(f_path / 'mission.md'),
-            },
-        }
-        result = Msg.access_granted(mtf_data)
-
-    elif isinstance(f_model, PydanticModels.Site):
-        site_data: AccessGrantedSiteData = {
-            'f_type': 'SITE',
-            'f_model': f_model.model_dump_json(),
-            'files': {
-                'loc': read_file(f_path / 'loc.md'),
-                'desc': read_file(f_path / 'desc.md'),
-                'dossier': read_file(f_path / 'dossier.md'),
-            },
-        }
-        result = Msg.access_granted(site_data)
-
-    else:
-        user_data: AccessGrantedUserData = {
-            'f_type': 'USER',
-            'f_model': f_model.model_dump_json(),
-            'files': {
-                # Users have no associated files
-            },
-        }
-        result = Msg.access_granted(user_data)
+    if entry[2] is None:  # encoded once, resent as is while cached
+        data = _BUILDERS[f_cls](f_model, f_path)
+        entry[2] = EncodedMessage(_access_granted(data))
+    result = entry[2]
 
 
     # === Log & Return ===
@@ -184,4 +502,5 @@ def access(
 
 __all__ = [
     'access',
+    'clear_access_cache',
 ]
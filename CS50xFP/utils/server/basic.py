@@ -4,19 +4,106 @@ Basic server functions
 Contains
 --------
 - auth_usr(user_id: int, password: str) -> tuple[bool, PydanticModels.User | None]
+- invalidate_auth(user_id: int) -> None
 """
 
+import os
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from time import monotonic_ns
+
+from sqlalchemy import update
 from werkzeug.security import check_password_hash
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
 from ..general.server_config import Server
 from ..general.validation import validate_int, validate_str
 
 
-from ..sql.queries import get_model, db_session
+from ..sql.queries import get_model
+from ..sql.core import db_session, db_read_session
 from ..sql.transformers import Models as PydanticModels, orm_to_pydantic
 from ..sql.schema import MainModels as ORMModels
 
 
+
+# === Password Hashing ===
+
+_HASHER = PasswordHasher(
+                         time_cost=2,
+                         memory_cost=19_456,  # KiB (OWASP argon2id minimum)
+                         parallelism=1
+                        )
+"""argon2id hasher (logins migrate stored hashes to it, so it's required)"""
+
+
+def _verify_password(stored: str, password: str) -> tuple[bool, str | None]:
+    """
+    Checks `password` against the `stored` hash
+
+    Verifies argon2 hashes with `_HASHER` & werkzeug (scrypt) hashes
+    with `check_password_hash`. A correct password with a werkzeug hash
+    (or outdated argon2 params) gets a new argon2id hash, so later
+    logins skip the slower scrypt check
+
+    Returns
+    -------
+    tuple[bool, str | None]
+        Whether `password` is correct, and the hash to store in
+        place of `stored` (None to keep it)
+    """
+    if stored.startswith('$argon2'):
+        try:
+            _HASHER.verify(stored, password)
+        except (VerificationError, InvalidHashError):
+            return False, None
+
+        if _HASHER.check_needs_rehash(stored):
+            return True, _HASHER.hash(password)
+        return True, None
+
+    if not check_password_hash(stored, password):
+        return False, None
+
+    return True, _HASHER.hash(password)
+
+
+
+# === Auth Cache ===
+
+_AUTH_KEY = os.urandom(32)
+"""Per-process key for hashing cached passwords (never leaves memory)"""
+
+_auth_cache: OrderedDict[
+                         tuple[int, bytes],
+                         tuple[int, PydanticModels.User]
+                        ] = OrderedDict()
+"""LRU of successful logins: `(user_id, keyed pw digest)` -> `(expiry ns, user)`"""
+_auth_cache_lock = Lock()
+
+
+def _auth_key(user_id: int, password: str) -> tuple[int, bytes]:
+    """Cache key for a login (the password is only kept as a keyed digest)"""
+    return user_id, blake2b(
+        password.encode(), digest_size=16, key=_AUTH_KEY
+    ).digest()
+
+
+def invalidate_auth(user_id: int) -> None:
+    """
+    Drops `user_id`'s cached logins
+
+    Call after changing a user's password or record,
+    so their next login is checked against the database
+    """
+    with _auth_cache_lock:
+        for key in [k for k in _auth_cache if k[0] == user_id]:
+            del _auth_cache[key]
+
+
 def auth_usr(
              user_id: int,
              password: str  # (TODO: Expect hashed password after FP submission)
@@ -57,7 +144,19 @@ def auth_usr(
     validate_int('user_id', user_id)
     validate_str('password', password)
 
-    with db_session() as session:
+    # recent successful login, skip the db & password hash
+    key = _auth_key(user_id, password)
+    now = monotonic_ns()
+
+    with _auth_cache_lock:
+        cached = _auth_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                _auth_cache.move_to_end(key)
+                return None, cached[1]
+            del _auth_cache[key]
+
+    with db_read_session() as session:
         user = session.get(ORMModels.User, user_id)
 
         if not user:
@@ -65,7 +164,9 @@ def auth_usr(
                 print('Failure, returning: user_id, None')
             return 'user_id', None
 
-        if not check_password_hash(str(user.password), password):
+        valid, new_hash = _verify_password(str(user.password), password)
+
+        if not valid:
             if Server.DEBUG:
                 print('Failure, returning: password, None')
             return 'password', None
@@ -73,7 +174,24 @@ def auth_usr(
         else:
             if Server.DEBUG:
                 print(f'Success, returning: True, {user!r}')
-            return None, orm_to_pydantic(user)
+            usr = orm_to_pydantic(user)
+
+    if new_hash is not None:  # upgrade (a write, so on the writer engine)
+        with db_session() as session:
+            session.execute(
+                update(ORMModels.User)
+                .where(ORMModels.User.id == user_id)
+                .values(password=new_hash)
+            )
+
+    # only successes are cached, failures always pay for the hash check
+    with _auth_cache_lock:
+        _auth_cache[key] = (now + Server.AUTH_CACHE_TTL * 10**9, usr)
+        _auth_cache.move_to_end(key)
+        if len(_auth_cache) > Server.AUTH_CACHE_S:
+            _auth_cache.popitem(last=False)
+
+    return None, usr
 
 
-__all__ = ['auth_usr']
+__all__ = ['auth_usr', 'invalidate_auth']
@@ -4,18 +4,211 @@ Helper funcs
 Contains
 --------
 - read_file(path: Path | str, encoding: str = 'utf-8') -> str
-- read_files(parent_dir: Path, files: list[str] | None = None, encoding: str = 'utf-8') -> dict[str, str]
+- read_files(parent_dir: Path | str, files: list[str] | None = None, encoding: str = 'utf-8') -> dict[str, str]
+- list_files(parent_dir: Path | str) -> list[str]
 """
 
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from threading import Lock
+from ..general.server_config import Server
 from ..general.sql_config import EXPUNGED
-from ..sql.queries import log_event
+from ..sql.log_writer import enqueue_event
 
 
 
+_READ_POOL = ThreadPoolExecutor(
+                                max_workers=Server.READ_WORKERS,
+                                thread_name_prefix='read_files'
+                               )
+"""Shared pool for concurrent file reads (threads start on first use)"""
+
+
+_O_READ = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+"""`os.open()` flags for reading (O_BINARY only exists on Windows)"""
+
+
+def _read_bytes(path: Path | str) -> bytes:
+    """
+    Reads `path` as raw bytes (the GIL is released during the read)
+
+    Uses a raw fd sized by `fstat()`: open, fstat, read, close
+    (no buffered IO object, seek or ioctl calls like `open()`)
+    """
+    fd = os.open(path, _O_READ)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)  # +1: a short read means EOF
+        if len(data) <= size:
+            return data
+
+        # file grew since fstat, read the rest
+        chunks = [data]
+        while chunk := os.read(fd, 1024 * 64):
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+
+class _OpenFile:
+    """A cached read only fd & the file (device, inode) it was opened on"""
+    __slots__ = ('fd', 'ident', 'users', 'evicted')
+
+    def __init__(self, fd: int, ident: tuple[int, int]) -> None:
+        self.fd = fd
+        self.ident = ident
+        self.users = 1       # readers using `fd` right now
+        self.evicted = False  # close `fd` once the last reader is done
+
+
+_fd_cache: OrderedDict[str, _OpenFile] = OrderedDict()
+"""LRU of path -> open fd, so a hot file is read without re-opening it"""
+_fd_cache_lock = Lock()
+
+_HAS_PREAD = hasattr(os, 'pread')
+"""`os.pread()` isn't available on Windows (files are re-opened there)"""
+
+
+def _retire(f: _OpenFile) -> None:
+    """Drops a cached fd, closing it now if unused (hold `_fd_cache_lock`)"""
+    f.evicted = True
+    if f.users == 0:
+        os.close(f.fd)
+
+
+def _release(f: _OpenFile) -> None:
+    """Marks a reader done with `f`, closing it if it was evicted meanwhile"""
+    with _fd_cache_lock:
+        f.users -= 1
+        if f.evicted and f.users == 0:
+            os.close(f.fd)
+
+
+def _acquire(path: str) -> tuple[_OpenFile, int]:
+    """
+    Gets an open fd for `path` (cached or newly opened) & its size
+
+    A cached fd is reused while `path` is still the same file, a file
+    replaced on disk (new inode) is re-opened. `_release()` when done
+
+    Raises
+    ------
+    FileNotFoundError
+        If `path` doesn't exist
+    """
+    st = os.stat(path)
+    ident = (st.st_dev, st.st_ino)
+
+    with _fd_cache_lock:
+        f = _fd_cache.get(path)
+        if f is not None:
+            if f.ident == ident:
+                f.users += 1
+                _fd_cache.move_to_end(path)
+                return f, st.st_size
+
+            del _fd_cache[path]  # replaced since it was opened
+            _retire(f)
+
+    fd = os.open(path, _O_READ)
+    st = os.fstat(fd)  # the file actually opened, if replaced since stat
+    f = _OpenFile(fd, (st.st_dev, st.st_ino))
+
+    with _fd_cache_lock:
+        old = _fd_cache.pop(path, None)  # another reader opened it too
+        if old is not None:
+            _retire(old)
+
+        _fd_cache[path] = f
+        if len(_fd_cache) > Server.FD_CACHE_S:
+            _retire(_fd_cache.popitem(last=False)[1])
+
+    return f, st.st_size
+
+
+def _read_cached(path: str) -> bytes:
+    """
+    Reads `path` as raw bytes through the fd cache
+
+    A cached file costs a `stat()` & a `pread()`, no open or close
+    """
+    f, size = _acquire(path)
+    try:
+        data = os.pread(f.fd, size + 1, 0)  # +1: a short read means EOF
+    finally:
+        _release(f)
+
+    if len(data) <= size:
+        return data
+    return _read_bytes(path)  # grew since stat, read it whole
+
+
+
+def _list_files(parent_dir: Path | str) -> tuple[list[str], list[str]]:
+    """
+    Names & paths of the regular files in `parent_dir` (one `scandir()`)
+
+    Uses d_type from the listing, no stat (symlinks are skipped).
+    Both lists are empty if `parent_dir` doesn't exist
+    """
+    names: list[str] = []
+    paths: list[str] = []
+    try:
+        with os.scandir(parent_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    names.append(entry.name)
+                    paths.append(entry.path)
+    except FileNotFoundError:
+        pass
+    return names, paths
+
+
+def list_files(parent_dir: Path | str) -> list[str]:
+    """
+    Lists the regular files in a directory
+
+    Parameters
+    ----------
+    parent_dir : Path | str
+        The directory to list
+
+    Returns
+    -------
+    list[str]
+        The local file names (empty if `parent_dir` not found)
+
+    Notes
+    -----
+    - Subdirectories & symlinks are skipped, as in `read_files()`
+    """
+    return _list_files(parent_dir)[0]
+
+
+
+def _read_text(path: Path | str, encoding: str) -> str | None:
+    """Reads & decodes `path` with universal newlines, None if not found"""
+    try:
+        if _HAS_PREAD:
+            data = _read_cached(os.fspath(path))
+        else:
+            data = _read_bytes(path)
+    except FileNotFoundError:
+        return None
+
+    text = data.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
 def read_file(
-              path: Path,
+              path: Path | str,
               encoding: str = 'utf-8'
              ) -> str:
     """
@@ -32,16 +225,23 @@ def read_file(
     -------
     str
         The result of `f.read()` or `EXPUNGED` if `path` not found
+
+    Notes
+    -----
+    - Reads raw bytes through an fd & decodes once (skips the IO layers)
+    - Keeps up to `Server.FD_CACHE_S` files open, so re-reading a hot
+      file skips the open & close (edits on disk are still read)
+    - Translates `\\r\\n` & `\\r` to `\\n` (like `open(..., 'r')`)
     """
-    if not path.exists():
-        return EXPUNGED
-    return path.read_text(encoding=encoding)
+    text = _read_text(path, encoding)
+    return EXPUNGED if text is None else text
 
 
 def read_files(
-               parent_dir: Path,
+               parent_dir: Path | str,
                files: list[str] | None = None,
-               encoding: str = 'utf-8'
+               encoding: str = 'utf-8',
+               skip_missing: bool = False
               ) -> dict[str, str]:
     """
     Reads text files from `parent_dir`
@@ -51,9 +251,12 @@ def read_files(
     parent_dir: Path | str
         The directory that contains `paths`
     files : list[str] | None = None
-        The local file names. If ommited, reads all files in `parent_dir`
+        The file names, relative to `parent_dir` (eg. `'addenda/1.md'`).
+        If ommited, reads all files in `parent_dir`
     encoding : str = 'utf-8'
         The encoding to pass to `open()`
+    skip_missing : bool = False
+        Whether to leave files not found out of the result
 
     Returns
     -------
@@ -62,20 +265,39 @@ def read_files(
 
     Notes
     -----
-    - Reads files as so: `parent_dir / file`
-    - If file not found, file data is `EXPUNGED`
+    - Reads files as so: `os.path.join(parent_dir, file)`
+    - If file not found, file data is `EXPUNGED` (or left out)
     - If `parent_dir` does not exist, all file datas are `EXPUNGED`
+    - Without `files`, lists `parent_dir` in one `os.scandir()` pass
+      (regular files only: subdirectories & symlinks are skipped) &
+      leaves out listed files that vanish before they are read
+    - Line endings are translated as in `read_file()`
+    - With `Server.PARALLEL_READ_MIN`+ files (given or listed), reads
+      them concurrently on a shared thread pool (order is kept)
     """
-    result = {}
-
-    if not parent_dir.exists():
-        return {f: EXPUNGED for f in files or []}
+    if files:
+        names = files
+        paths = [os.path.join(parent_dir, f) for f in files]
+    else:
+        names, paths = _list_files(parent_dir)
+        skip_missing = True
 
-    if not files:
-        files = [f.name for f in parent_dir.iterdir()]
+    if len(paths) >= Server.PARALLEL_READ_MIN:
+        texts = _READ_POOL.map(_read_text, paths, repeat(encoding))
+    else:
+        texts = map(_read_text, paths, repeat(encoding))
 
+    if skip_missing:
+        return {
+            name: text
+            for name, text in zip(names, texts)
+            if text is not None
+        }
 
-    return {f: read_file(parent_dir / f, encoding) for f in files}
+    return {
+        name: EXPUNGED if text is None else text
+        for name, text in zip(names, texts)
+    }
 
 
 def log_access(
@@ -101,9 +323,10 @@ def log_access(
     Notes
     -----
     - Does not validate parameters
-    - A wrapper for `sql.queries.log_event()`
+    - A wrapper for `sql.log_writer.enqueue_event()`: written in the
+      background, so access requests don't wait on the INSERT
     """
-    log_event(
+    enqueue_event(
             user_id=user_id,
             user_ip=user_ip,
             action='File Access',
@@ -112,4 +335,4 @@ def log_access(
         )
 
 
-__all__ = ['read_file', 'read_files', 'log_access']
\ No newline at end of file
+__all__ = ['read_file', 'read_files', 'list_files', 'log_access']
\ No newline at end of file
@@ -4,26 +4,215 @@ Main server instance (Run this to start the server)
 Contains
 --------
 - handle_usr(client: socket.socket, c_ip: str, t_id: int) -> None
+- serve(server: socket.socket, pool: ThreadPoolExecutor) -> None
 """
 
+import selectors
 import socket
-from threading import active_count, Thread
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
+from typing import Callable, Iterator, cast
+from threading import Lock, stack_size
 from itertools import count
 
 from .actions import access
 from .basic import auth_usr
-from ..socket import send, recv, MessageTypes, gen_socket_conn
-from ..socket.protocol import AuthRequest, AccessRequest
+from ..socket import send, send_msg, recv, has_pending, MessageTypes, \
+                     Msg, gen_socket_conn
+from ..socket.protocol import AuthRequest, AccessRequest, Message
+from ..sql.core import remove_session
+from ..sql.transformers import Models as PydanticModels
+from ..general.server_config import Server
 from ..general.validation import validate_msg
 
 
+# === Client Tracking ===
+
+class _Client:
+    """A connected client & its session state"""
+    __slots__ = ('conn', 'ip', 't_id', 'usr')
+
+    def __init__(self, conn: socket.socket, ip: str, t_id: int) -> None:
+        self.conn = conn
+        self.ip = ip
+        self.t_id = t_id
+        self.usr: PydanticModels.User | None = None  # set once authenticated
+
+
+_clients: set[socket.socket] = set()
+"""Connected client sockets (closed on shutdown)"""
+_clients_lock = Lock()
+
+
+
+# === Request Handlers ===
+
+def _handle_access(
+                   msg: Message,
+                   usr: PydanticModels.User,
+                   c_ip: str
+                  ) -> Message:
+    """Handles an `ACCESS_REQUEST` message"""
+    access_msg = cast(AccessRequest, msg)
+
+    return access(
+        access_msg['data']['f_type'],
+        access_msg['data']['f_id'],
+        usr,
+        c_ip
+    )
+
+
+_HANDLERS: dict[
+                MessageTypes,
+                Callable[[Message, PydanticModels.User, str], Message]
+               ] = {
+    MessageTypes.ACCESS_REQUEST: _handle_access,
+}
+"""Handler for each message type accepted after authentication"""
+
+
+def _recv(client: _Client) -> Message | None:
+    """`recv()` from `client`, or None if it stalled past its timeout"""
+    try:
+        return recv(client.conn)
+    except ConnectionError as e:
+        if not isinstance(e.__cause__, TimeoutError):
+            raise
+        print(f'[THREAD {client.t_id}] Timed out waiting on {client.ip}')
+        return None
+
+
+def _serve_one(client: _Client) -> bool:
+    """
+    Receives & responds to one message from `client`
+
+    The first message must authenticate, the rest are dispatched
+    through `_HANDLERS`
+
+    Returns
+    -------
+    bool
+        Whether to keep the connection open
+    """
+    t_id, c_ip = client.t_id, client.ip
+
+    # === Authenticate user ===
+
+    if client.usr is None:
+        msg = _recv(client)
+        if msg is None:
+            return False
+
+        auth_msg = validate_msg(msg, AuthRequest)
+
+        invalid_field, usr = auth_usr(
+            auth_msg['data']['user_id'], auth_msg['data']['password']
+        )
+
+        # auth failed (or not usr to make type checker happy)
+        if invalid_field or not usr:
+            send(
+                client.conn, MessageTypes.AUTH_FAILED,
+                {'field': invalid_field}
+            )
+            print(f'[THREAD {t_id}] Authentication failed for {c_ip}')
+            return False
+
+        # auth success
+        send_msg(client.conn, Msg.auth_success(usr))
+        print(f'[THREAD {t_id}] Authentication successful for {c_ip}')
+        client.usr = usr
+        return True
+
+
+    # === Handle requests ===
+
+    # get request (`recv` validates it)
+    try:
+        msg = _recv(client)
+    except ConnectionAbortedError:
+        print(f'[THREAD {t_id}] Connection closed by {c_ip}')
+        return False
+
+    if msg is None:
+        return False
+
+    # dispatch
+    handler = _HANDLERS.get(msg['type'])
+
+    if handler is None:
+        print(
+              f'[THREAD {t_id}] Unexpected {msg["type"]!r} '
+              f'message from {c_ip}'
+             )
+        return False
+
+    # respond (already built & validated by the handler)
+    send_msg(client.conn, handler(msg, client.usr, c_ip))
+    return True
+
+
+def _close(client: _Client) -> None:
+    """Closes `client`'s connection & stops tracking it"""
+    print(f'[THREAD {client.t_id}] Closing connection to {client.ip}')
+    client.conn.close()
+    remove_session()
+
+    with _clients_lock:
+        _clients.discard(client.conn)
+        active = len(_clients)
+
+    print(f'[THREAD {client.t_id}] Done | Active connections: {active}')
+
+
+
+def _accept_all(
+                server: socket.socket,
+                sel: selectors.BaseSelector,
+                t_ids: Iterator[int]
+               ) -> None:
+    """
+    Accepts every pending connection on the non-blocking `server` &
+    registers each with `sel`
+
+    Draining the backlog per wakeup, a burst of connections
+    costs one `select()` instead of one each
+    """
+    while True:
+        try:
+            conn, addr = server.accept()
+        except (BlockingIOError, InterruptedError):
+            return  # backlog empty
+
+        # workers use blocking reads, bounded so a stalled
+        # client can't hold a worker forever
+        conn.settimeout(Server.CLIENT_TIMEOUT)
+        client = _Client(conn, addr[0], next(t_ids))
+
+        with _clients_lock:
+            _clients.add(conn)
+            active = len(_clients)
+
+        print(
+              f'[Server] Connection from {client.ip} | '
+              f'Thread ID: {client.t_id}'
+             )
+        print(f'[Server] Active connections: {active}')
+
+        sel.register(conn, selectors.EVENT_READ, client)
+
+
+
+# === Main Funcs ===
+
 def handle_usr(
                client: socket.socket,
                c_ip: str,
                t_id: int
               ) -> None:
     """
-    Handles a user connection (run on server threads)
+    Handles a user connection until it closes (blocks the calling thread)
 
     Parameters
     ----------
@@ -33,99 +222,123 @@ def handle_usr(
         the client's ip address
     t_id : int
         the thread id
+
+    Notes
+    -----
+    - The server itself uses `serve()`, which doesn't
+      hold a thread while a client is idle
     """
+    c = _Client(client, c_ip, t_id)
 
     try:
+        while _serve_one(c):
+            pass
 
-        # === Authenticate user ===
+    # ensure conn is always closed
+    finally:
+        _close(c)
 
-        auth_msg = validate_msg(recv(client), AuthRequest)
 
-        invalid_field, usr = auth_usr(
-            auth_msg['data']['user_id'], auth_msg['data']['password']
-        )
+def serve(server: socket.socket, pool: ThreadPoolExecutor) -> None:
+    """
+    Accepts & serves clients until interrupted (Ctrl+C)
 
-        # auth failed (or not usr to make type checker happy)
-        if invalid_field or not usr:
-            send(
-                client, MessageTypes.AUTH_FAILED,
-                {'field': invalid_field}
-            )
-            print(f'[THREAD {t_id}] Authentication failed for {c_ip}')
-            return
+    One selector thread waits on every connection, and only clients
+    with a request waiting are handed to `pool`, so idle clients
+    cost a socket, not a thread
 
+    Parameters
+    ----------
+    server : socket.socket
+        the bound, listening server socket
+    pool : ThreadPoolExecutor
+        the workers to handle requests on
+    """
+    t_ids = count(1)
+    sel = selectors.DefaultSelector()
+    server.setblocking(False)  # see `_accept_all()`
 
-        # auth success
-        send(
-            client, MessageTypes.AUTH_SUCCESS,
-            {'user': usr.model_dump_json()}
-        )
-        print(f'[THREAD {t_id}] Authentication successful for {c_ip}')
+    # workers hand clients back to the selector thread through `rearm`,
+    # writing to `wake_w` to interrupt `sel.select()`
+    rearm: SimpleQueue[_Client] = SimpleQueue()
+    wake_r, wake_w = socket.socketpair()
+
+    def work(client: _Client) -> None:
+        """Serves `client`'s waiting request(s), then re-arms or closes it"""
+        try:
+            keep = _serve_one(client)
 
+            # next request(s) already read ahead (won't wake the selector)
+            while keep and has_pending(client.conn):
+                keep = _serve_one(client)
 
-        # Handle access requests
+        except Exception as e:
+            print(f'[THREAD {client.t_id}] Error: {e}')
+            keep = False
+
+        if keep:
+            rearm.put(client)
+            wake_w.send(b'\0')
+        else:
+            _close(client)
+
+    sel.register(server, selectors.EVENT_READ)
+    sel.register(wake_r, selectors.EVENT_READ)
+
+    try:
         while True:
+            for key, _ in sel.select():
 
-            # get access request
-            try:
-                access_msg = validate_msg(recv(client), AccessRequest)
-            except ConnectionAbortedError:
-                print(f'[THREAD {t_id}] Connection closed by {c_ip}')
-                break
-
-            # process
-            access_response = access(
-                access_msg['data']['f_type'],
-                access_msg['data']['f_id'],
-                usr,
-                c_ip
-            )
+                if key.fileobj is server:  # new client(s)
+                    _accept_all(server, sel, t_ids)
 
-            # respond
-            send(
-                client, access_response['type'],
-                access_response['data']
-            )
+                elif key.fileobj is wake_r:  # clients done with a request
+                    wake_r.recv(4096)
+                    while not rearm.empty():
+                        client = rearm.get()
+                        sel.register(client.conn, selectors.EVENT_READ, client)
+
+                else:  # client sent a request
+                    sel.unregister(key.fileobj)
+                    pool.submit(work, key.data)
 
-    # ensure conn is always closed
     finally:
-        print(f'[THREAD {t_id}] Closing connection to {c_ip}')
-        client.close()
-        print(
-              f'[THREAD {t_id}] Done | Active '
-              f'connections: {active_count() - 2}'
-             )
+        sel.close()
+        wake_r.close()
+        wake_w.close()
 
 
 
 if __name__ == '__main__':
     """Starts the server and listens for connections"""
-    thread_counter = count(1)
 
-    with gen_socket_conn(bind=True) as server:
-        print('[Server] Waiting for a connection . . .')
-        server.listen()
+    # workers only run requests, so keep their stacks light
+    stack_size(Server.THREAD_STACK_S)
 
-        while True:
-            try:
-                conn, addr = server.accept()
+    # bounded: past MAX_CLIENTS requests at once, requests wait for a worker
+    pool = ThreadPoolExecutor(
+                              max_workers=Server.MAX_CLIENTS,
+                              thread_name_prefix='scipnet'
+                             )
 
-                ip = addr[0]  # conn ip
+    with gen_socket_conn(bind=True) as server:
+        print('[Server] Waiting for a connection . . .')
+        server.listen(Server.LISTEN_BACKLOG)
 
-                print(
-                      f'[Server] Connection from {ip} | '
-                      f'Thread ID: {active_count() - 1}'
-                     )
+        try:
+            serve(server, pool)
+        except KeyboardInterrupt:
+            print('[Server] Exiting')
 
-                Thread(
-                       target=handle_usr,
-                       args=(conn, ip, next(thread_counter))
-                      ).start()
+    # unblock handlers mid request so the workers can exit
+    with _clients_lock:
+        for conn in _clients:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # already closed
 
-                print(f'[Server] Active connections: {active_count() - 1}')
-            except KeyboardInterrupt:
-                print('[Server] Exiting')
-                break
+    pool.shutdown(cancel_futures=True)
 
 
-__all__ = ['handle_usr']
+__all__ = ['handle_usr', 'serve']
@@ -8,7 +8,10 @@ Contains
 - MessageTypes
 
 - send
+- send_msg
+- send_many
 - recv
+- has_pending
 
 - test_send
 - test_recv
@@ -17,7 +20,7 @@ Contains
 """
 
 
-from .transport import send, recv
+from .transport import send, send_msg, send_many, recv, has_pending
 
 from .builders import (
     gen_auth_request,
@@ -88,7 +91,10 @@ class Protocol:
 
 __all__ = [
            'send',
+           'send_msg',
+           'send_many',
            'recv',
+           'has_pending',
 
            'MessageTypes',
 
@@ -9,6 +9,7 @@ Contains
 - gen_auth_success
 
 - gen_access_request
+- gen_access_type_fail
 - gen_access_redacted
 - gen_access_expunged
 - gen_access_granted
@@ -28,6 +29,20 @@ from ..general.server_config import Server as ServerCfg
 
 
 
+_VALID_F_TYPES = tuple(ServerCfg.VALID_F_TYPES)
+"""File types listed in AccessTypeFail messages (config, fixed at import)"""
+
+# message type values, bound once (no enum attribute lookup per message)
+_AUTH_REQUEST = MessageTypes.AUTH_REQUEST.value
+_AUTH_FAILED = MessageTypes.AUTH_FAILED.value
+_AUTH_SUCCESS = MessageTypes.AUTH_SUCCESS.value
+_ACCESS_REQUEST = MessageTypes.ACCESS_REQUEST.value
+_ACCESS_TYPE_FAIL = MessageTypes.ACCESS_TYPE_FAIL.value
+_ACCESS_REDACTED = MessageTypes.ACCESS_REDACTED.value
+_ACCESS_EXPUNGED = MessageTypes.ACCESS_EXPUNGED.value
+_ACCESS_GRANTED = MessageTypes.ACCESS_GRANTED.value
+
+
 
 # === Main Generator Func ===
 
@@ -135,6 +150,8 @@ def gen_msg(
 
 
 # === Generator Implementations ===
+# each builder validates its own fields, then builds the message directly
+# (`gen_msg()` would re-validate the type & every field again)
 
 def gen_auth_request(
                      user_id: int,
@@ -158,13 +175,13 @@ def gen_auth_request(
     validate_int('user_id', user_id)
     validate_str('password', password)
 
-    return gen_msg(
-        MessageTypes.AUTH_REQUEST,
-        {
-         'user_id': user_id,
-         'password': password
+    return cast(Messages.AuthRequest, {
+        'type': _AUTH_REQUEST,
+        'data': {
+            'user_id': user_id,
+            'password': password
         }
-    )
+    })
 
 def gen_auth_failed(
                     field: str
@@ -184,12 +201,12 @@ def gen_auth_failed(
     """
     validate_str('field', field)
 
-    return gen_msg(
-        MessageTypes.AUTH_FAILED,
-        {
-         'field': field
+    return cast(Messages.AuthFailed, {
+        'type': _AUTH_FAILED,
+        'data': {
+            'field': field
         }
-    )
+    })
 
 def gen_auth_success(
                       user: PyModels.User
@@ -206,17 +223,18 @@ def gen_auth_success(
     -------
     AuthSuccess : dict[str, Any]
         The generated AuthSuccess message
-    """
-    dumped = user.model_dump()
 
-    validate_dict('user', dumped)
-
-    return gen_msg(
-        MessageTypes.AUTH_SUCCESS,
-        {
-         'user': dumped
+    Notes
+    -----
+    - `user` is dumped once, straight to JSON by pydantic-core
+      (the str the client's `User.model_validate_json()` expects)
+    """
+    return cast(Messages.AuthSuccess, {
+        'type': _AUTH_SUCCESS,
+        'data': {
+            'user': user.model_dump_json()
         }
-    )
+    })
 
 
 def gen_access_request(
@@ -241,13 +259,13 @@ def gen_access_request(
     validate_str('f_type', f_type)
     validate_int('f_id', f_id, False, False)
 
-    return gen_msg(
-        MessageTypes.ACCESS_REQUEST,
-        {
-         'f_type': f_type,
-         'f_id': f_id
+    return cast(Messages.AccessRequest, {
+        'type': _ACCESS_REQUEST,
+        'data': {
+            'f_type': f_type,
+            'f_id': f_id
         }
-    )
+    })
 
 def gen_access_type_fail(
                          tried: str
@@ -267,13 +285,13 @@ def gen_access_type_fail(
     """
     validate_str('tried', tried)
 
-    return gen_msg(
-        MessageTypes.ACCESS_TYPE_FAIL,
-        {
-         'tried': tried,
-         'valid': [k for k in ServerCfg.VALID_F_TYPES.keys()]
+    return cast(Messages.AccessTypeFail, {
+        'type': _ACCESS_TYPE_FAIL,
+        'data': {
+            'tried': tried,
+            'valid': list(_VALID_F_TYPES)  # a copy, the message may be edited
         }
-    )
+    })
 
 def gen_access_redacted(
                         user_clear: str,
@@ -305,15 +323,15 @@ def gen_access_redacted(
     validate_str('needed_clear', needed_clear)
     validate_hex('needed_hex', needed_hex)
 
-    return gen_msg(
-        MessageTypes.ACCESS_REDACTED,
-        {
-         'user_clear': user_clear,
-         'user_hex': user_hex,
-         'needed_clear': needed_clear,
-         'needed_hex': needed_hex
+    return cast(Messages.AccessRedacted, {
+        'type': _ACCESS_REDACTED,
+        'data': {
+            'user_clear': user_clear,
+            'user_hex': user_hex,
+            'needed_clear': needed_clear,
+            'needed_hex': needed_hex
         }
-    )
+    })
 
 def gen_access_expunged(
                         f_type: str,
@@ -337,13 +355,13 @@ def gen_access_expunged(
     validate_str('f_type', f_type)
     validate_int('f_id', f_id, False, False)
 
-    return gen_msg(
-        MessageTypes.ACCESS_EXPUNGED,
-        {
-         'f_type': f_type,
-         'f_id': f_id
+    return cast(Messages.AccessExpunged, {
+        'type': _ACCESS_EXPUNGED,
+        'data': {
+            'f_type': f_type,
+            'f_id': f_id
         }
-    )
+    })
 
 def gen_access_granted(
                        data: AccessGrantedData
@@ -375,7 +393,7 @@ def gen_access_granted(
     # get and validate data format
     validate_dict('data', data, ag_format_map[f_type])
 
-    return gen_msg(
-        MessageTypes.ACCESS_GRANTED,
-        data
-    )
+    return cast(Messages.AccessGranted, {
+        'type': _ACCESS_GRANTED,
+        'data': data
+    })
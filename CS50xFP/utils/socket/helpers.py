@@ -2,11 +2,15 @@
 Helpers for socket operations
 """
 
-from json import dumps, loads, JSONDecodeError
+from json import JSONEncoder, loads, JSONDecodeError
 import socket
-from struct import pack
-from typing import Any, Generator
-from contextlib import contextmanager
+from types import TracebackType
+from typing import Any, Callable
+
+try:  # optional: faster & encodes straight to bytes
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..general.server_config import Socket as SockConf
 from ..general.validation import validate_data, validate_conn, validate_field
@@ -20,6 +24,47 @@ ExceptionTypes = type[Exception] | tuple[type[Exception], ...]
 
 
 
+# === Codec ===
+
+_JSON_ENCODER = JSONEncoder(separators=(',', ':'))
+"""Shared compact encoder (`dumps()` builds a new one per call for non-default args)"""
+
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[bytes | bytearray | memoryview], Any]
+
+if orjson is not None:
+    _dumps = orjson.dumps  # compact, utf-8 bytes (no str step)
+    _loads = orjson.loads  # its JSONDecodeError subclasses json's
+else:
+    def _dumps(data: Any) -> bytes:
+        return _JSON_ENCODER.encode(data).encode()
+
+    def _loads(data: bytes | bytearray | memoryview) -> Any:
+        # takes utf-8 bytes directly (no str copy), but not a memoryview
+        if type(data) is memoryview:
+            data = data.tobytes()
+        return loads(data)
+
+
+
+# === Pre-encoded Messages ===
+
+class EncodedMessage(dict):
+    """
+    A message dict that keeps its encoded frame
+
+    For messages sent many times unchanged (eg. cached files), so
+    `send_msg()` skips re-encoding them. Don't mutate after creation
+    """
+    __slots__ = ('frame',)
+
+    def __init__(self, msg: Any) -> None:
+        super().__init__(msg)
+        self.frame = encode(self)
+        """The encoded message (`encode(msg)`)"""
+
+
+
 # === Main Functions ===
 
 def gen_socket_conn(
@@ -31,6 +76,7 @@ def gen_socket_conn(
     - AF_INET as address family
     - SOCK_STREAM as socket type
     - Default timeout from SockConf (if connecting)
+    - Kernel buffer sizes & TCP_NODELAY from SockConf
 
     Parameters
     ----------
@@ -54,6 +100,14 @@ def gen_socket_conn(
 
     conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
+    # before bind/connect so the TCP window is sized at handshake
+    # (accepted conns inherit these from the listening socket)
+    conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SockConf.SO_RCVBUF)
+    conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SockConf.SO_SNDBUF)
+
+    if SockConf.TCP_NODELAY:
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     if bind:
         conn.bind(SockConf.ADDR)
     if connect:
@@ -63,6 +117,43 @@ def gen_socket_conn(
     return conn
 
 
+def encode_parts(data: Any) -> tuple[bytes, bytes]:
+    """
+    Encodes `data` as a size header & payload, without joining them
+
+    Parameters
+    ----------
+    data : Any
+        The data to encode
+
+    Returns
+    -------
+    tuple[bytes, bytes]
+        - [4 bytes size]
+        - [compact JSON encoded data]
+
+    Raises
+    ------
+    ValueError
+        If `data` is None or empty
+    MaxSizeLimitError
+        If the encoded data size exceeds maximum allowed size
+
+    Notes
+    -----
+    - For scatter/gather sends (`sendmsg()`), which skip copying
+      the payload into one buffer with its header
+    """
+    validate_data(data)
+
+    encoded_data = _dumps(data)
+    total = SockConf.HEADER_S + len(encoded_data)
+
+    if total > SockConf.MAX_MSG_S:
+        raise MaxSizeLimitError(total, SockConf.MAX_MSG_S)
+    return SockConf.pack_header(len(encoded_data)), encoded_data
+
+
 def encode(data: Any) -> bytes:
     """
     Encodes `data` as bytes
@@ -76,7 +167,7 @@ def encode(data: Any) -> bytes:
     -------
     bytes
         The encoded data in the format:
-        [4 bytes size][JSON encoded data]
+        [4 bytes size][compact JSON encoded data]
 
     Raises
     ------
@@ -85,44 +176,34 @@ def encode(data: Any) -> bytes:
     MaxSizeLimitError
         If the encoded data size exceeds maximum allowed size
     """
-    validate_data(data)
-
-    encoded_data = dumps(data).encode()
-    size = pack(SockConf.S_TYPE, len(encoded_data))
-    result = size + encoded_data
-
-    if len(result) > SockConf.MAX_MSG_S:
-        raise MaxSizeLimitError(len(result), SockConf.MAX_MSG_S)
-    return result
+    return b''.join(encode_parts(data))
 
-def decode(data: bytes) -> Any:
+def decode(data: bytes | bytearray | memoryview) -> Any:
     """
     Decodes `data` from bytes to original format
 
     Parameters
     ----------
-    data : bytes
+    data : bytes | bytearray | memoryview
         The data to decode
 
     Returns
     -------
     Any
         The decoded data
+
+    Notes
+    -----
+    - With orjson, a memoryview is parsed in place (no copy)
     """
-    validate_field('data', data, bytes)
+    validate_field('data', data, bytes | bytearray | memoryview)
 
     try:
-        return loads(data.decode())
+        return _loads(data)
     except (UnicodeDecodeError, JSONDecodeError) as e:
         raise MessageDecodeError(e) from e
 
-@contextmanager
-def socket_context_manager(
-                           message: str,
-                           conn: socket.socket,
-                           short_timeout: bool = False,
-                           reraise: ExceptionTypes = ConnectionError
-                          ) -> Generator[None, None, None]:
+class socket_context_manager:
     """
     Context manager to simplify socket operations:
     - Validates `conn`
@@ -144,33 +225,53 @@ def socket_context_manager(
     reraise : type[Exception] | tuple[type[Exception], ...] = ConnectionError
         The exception(s) to reraise
 
-    Yields
-    ------
-    None
-
     Raises
     ------
     TypeError
         If `conn` is not a socket.socket instance
     ConnectionError
         If an exception not in `reraise` occurs: f'{message}: {e}'
-    """
-    validate_conn(conn)
-
-    if short_timeout:
-        conn.settimeout(SockConf.TMP_TIMEOUT)
-
-    try:
-        yield
-
-    except reraise:
-        raise
-    except Exception as e:
-        raise ConnectionError(f'{message}: {e}') from e
 
-    finally:
-        if short_timeout:
-            conn.settimeout(SockConf.DEF_TIMEOUT)
+    Notes
+    -----
+    - A plain class, not `@contextmanager`: no generator
+      frame per use (it wraps every send & recv)
+    """
+    __slots__ = ('message', 'conn', 'short_timeout', 'reraise')
+
+    def __init__(
+                 self,
+                 message: str,
+                 conn: socket.socket,
+                 short_timeout: bool = False,
+                 reraise: ExceptionTypes = ConnectionError
+                ) -> None:
+        self.message = message
+        self.conn = conn
+        self.short_timeout = short_timeout
+        self.reraise = reraise
+
+    def __enter__(self) -> None:
+        validate_conn(self.conn)
+
+        if self.short_timeout:
+            self.conn.settimeout(SockConf.TMP_TIMEOUT)
+
+    def __exit__(
+                 self,
+                 exc_type: type[BaseException] | None,
+                 exc: BaseException | None,
+                 tb: TracebackType | None
+                ) -> bool:
+        if self.short_timeout:
+            self.conn.settimeout(SockConf.DEF_TIMEOUT)
+
+        # no error, an error to reraise, or not an Exception (eg. Ctrl+C)
+        if exc is None or isinstance(exc, self.reraise) \
+                or not isinstance(exc, Exception):
+            return False
+
+        raise ConnectionError(f'{self.message}: {exc}') from exc
 
 
 def test_send(conn: socket.socket) -> None:
@@ -19,7 +19,7 @@ from enum import StrEnum
 
 # === Message Formats ===
 
-MESSAGE_KEYS = {'type', 'data'}
+MESSAGE_KEYS = frozenset({'type', 'data'})
 """All keys present in every message TypedDict"""
 
 
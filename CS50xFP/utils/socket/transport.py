@@ -3,11 +3,12 @@ Socket utilities for client and server communication
 """
 
 # TODO: Implement TLS: after submit final project
-from struct import unpack
 from typing import Any, cast, Mapping
 import socket
+from weakref import WeakKeyDictionary
 
-from .helpers import encode, decode, socket_context_manager
+from .helpers import encode_parts, decode, socket_context_manager, \
+                     EncodedMessage
 from .builders import gen_msg
 from .protocol import MessageTypes, Message, MessageData
 from ..general.server_config import Socket as SockConf
@@ -15,6 +16,48 @@ from ..general.exceptions import MaxSizeLimitError
 from ..general.validation import validate_msg
 
 
+# === Read-ahead State ===
+
+_pending: WeakKeyDictionary[socket.socket, bytearray] = WeakKeyDictionary()
+"""Bytes read past the end of the last message, per connection"""
+
+
+
+# === Helpers ===
+
+def has_pending(conn: socket.socket) -> bool:
+    """
+    Whether bytes past the last message from `conn` were already read
+
+    If so, the next `recv()` may not need the socket to be readable
+    (eg. don't wait on a selector before calling it)
+    """
+    return conn in _pending
+
+
+def _send_bufs(conn: socket.socket, bufs: list[bytes]) -> None:
+    """
+    Sends `bufs` back to back over `conn`, like `sendall(b''.join(bufs))`
+
+    Uses `sendmsg()` (scatter/gather) where available,
+    so the buffers are never copied into one
+    """
+    if not hasattr(conn, 'sendmsg'):  # eg. Windows
+        conn.sendall(b''.join(bufs))
+        return
+
+    sent = conn.sendmsg(bufs)
+
+    # partial write, send the rest of each buffer (views, no copies)
+    for buf in bufs:
+        if sent >= len(buf):
+            sent -= len(buf)
+            continue
+        conn.sendall(memoryview(buf)[sent:])
+        sent = 0
+
+
+
 # === Main Funcs ===
 
 # TODO: Add overloads similar to builders.py (after submit final project)
@@ -46,12 +89,93 @@ def send(
     """
 
     # build data
-    data = encode(gen_msg(msg_type, cast(MessageData, msg_data)))
+    bufs = list(encode_parts(gen_msg(msg_type, cast(MessageData, msg_data))))
 
     with socket_context_manager(
         'Error sending data', conn,
     ):
-        conn.sendall(data)
+        _send_bufs(conn, bufs)
+
+
+def send_msg(conn: socket.socket, msg: Message) -> None:
+    """
+    Sends an already built Message over `conn`
+
+    Parameters
+    ----------
+    conn : socket.socket
+        The socket connection to send data over
+    msg : Message
+        The message to send (eg. from a `Msg` builder)
+
+    Raises
+    ------
+    TypeError
+        If `conn` is not a socket.socket instance
+    ValueError
+        If `msg` is None or empty
+    ConnectionError
+        If there is an error transmitting data
+
+    Notes
+    -----
+    - Skips `gen_msg()`, as `msg` was validated when it was built
+    - An `EncodedMessage` is sent as is (no re-encoding)
+    """
+
+    # build data
+    if isinstance(msg, EncodedMessage):
+        bufs = [msg.frame]
+    else:
+        bufs = list(encode_parts(msg))
+
+    with socket_context_manager(
+        'Error sending data', conn,
+    ):
+        _send_bufs(conn, bufs)
+
+
+def send_many(
+              conn: socket.socket,
+              *msgs: tuple[MessageTypes, Mapping[str, Any]]
+             ) -> None:
+    """
+    Builds a Message from each `(msg_type, msg_data)` pair in `msgs` and
+    sends them all over `conn` in one write
+
+    Parameters
+    ----------
+    conn : socket.socket
+        The socket connection to send data over
+    *msgs : tuple[MessageTypes, Mapping[str, Any]]
+        The message type & data of each message, in send order
+
+    Raises
+    ------
+    TypeError
+        If `conn` is not a socket.socket instance
+    ValueError
+        If any message data is None or empty
+    ConnectionError
+        If there is an error transmitting data
+
+    Notes
+    -----
+    - Uses `sendmsg()` (scatter/gather) where available, so back-to-back
+      messages share TCP segments without being joined into one buffer
+    """
+
+    # build data
+    bufs = [
+        buf
+        for msg_type, msg_data in msgs
+        for buf in encode_parts(gen_msg(msg_type, cast(MessageData, msg_data)))
+    ]
+
+    with socket_context_manager(
+        'Error sending data', conn,
+    ):
+        _send_bufs(conn, bufs)
 
 
 def recv(conn: socket.socket) -> Message:
@@ -79,47 +203,76 @@ def recv(conn: socket.socket) -> Message:
         - Message size exceeds maximum allowed size
     MaxSizeLimitError
         If the received message size exceeds maximum allowed size
+
+    Notes
+    -----
+    - Reads up to `SockConf.RCV_S` bytes at a time, so small messages
+      arrive in one syscall; extra bytes are kept for the next call
     """
 
     with socket_context_manager(
         'Error receiving data', conn,
         reraise=(MaxSizeLimitError, ConnectionError, ConnectionAbortedError)
     ):
-        # get size header
-        header = conn.recv(SockConf.HEADER_S)
+        # read ahead: header & (usually) the whole body in one recv,
+        # starting from anything left over from the last message
+        buf = _pending.pop(conn, None)
 
-        if not header or len(header) != SockConf.HEADER_S:
+        if buf is None:
+            buf = bytearray(SockConf.RCV_S)
+            del buf[conn.recv_into(buf):]
+
+        while 0 < len(buf) < SockConf.HEADER_S:  # header split across reads
+            more = bytearray(SockConf.HEADER_S - len(buf))
+            n = conn.recv_into(more)
+            if not n:
+                break
+            buf += more[:n]
+
+        if len(buf) < SockConf.HEADER_S:
             raise ConnectionError(
-                f'Connection lost or received incomplete size header: {header!r}'
+                f'Connection lost or received incomplete size header: {bytes(buf)!r}'
             )
 
-        msg_size = unpack(SockConf.S_TYPE, header)[0]
+        msg_size = SockConf.unpack_header(buf[:SockConf.HEADER_S])[0]
 
         # validate
         if msg_size > SockConf.MAX_MSG_S:
             raise MaxSizeLimitError(msg_size, SockConf.MAX_MSG_S, False)
 
-        # prevent infinite loop when receiving
-        max_chunks = msg_size // SockConf.RCV_S + 1
-        chunk_count = 0
+        msg_end = SockConf.HEADER_S + msg_size
 
-        # receive exactly `msg_size` bytes
-        data = b''
+        # whole message already read
+        if len(buf) >= msg_end:
+            if len(buf) > msg_end:  # keep the start of the next message
+                _pending[conn] = buf[msg_end:]
 
-        while len(data) < msg_size:
-            if chunk_count > max_chunks:
-                raise ConnectionError('Exceeded expected message chunks')
+            data: bytearray | memoryview = \
+                memoryview(buf)[SockConf.HEADER_S:msg_end]  # no copy
 
-            remaining = msg_size - len(data)
-            buff = conn.recv(min(SockConf.RCV_S, remaining))
+        else:
+            # receive the rest of `msg_size` bytes straight into one buffer
+            # (each read makes progress or raises, so the loop is bounded
+            # by `msg_size`; TCP may deliver far smaller pieces than RCV_S)
+            data = bytearray(msg_size)
+            received = len(buf) - SockConf.HEADER_S
+            data[:received] = buf[SockConf.HEADER_S:]
+            view = memoryview(data)
 
-            if not buff: # check buffer
-                raise ConnectionAbortedError(
-                    'Connection lost during data reception'
+            while received < msg_size:
+                n = conn.recv_into(
+                    view[received:],
+                    min(SockConf.RCV_S, msg_size - received)
                 )
 
-            data += buff
-            chunk_count += 1
+                if not n: # check buffer
+                    raise ConnectionAbortedError(
+                        'Connection lost during data reception'
+                    )
+
+                received += n
+
+            view.release()
 
     # decode, validate, & return
     decoded = decode(data)
@@ -130,5 +283,8 @@ def recv(conn: socket.socket) -> Message:
 
 __all__ = [
            'send',
+           'send_msg',
+           'send_many',
            'recv',
+           'has_pending',
           ]
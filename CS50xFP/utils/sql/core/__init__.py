@@ -4,9 +4,15 @@ Core SQLAlchemy utilities
 Contains
 --------
 engine : Engine
-    Global SQLAlchemy engine instance
+    Global SQLAlchemy engine instance (writer)
+read_engine : Engine
+    Global read-only SQLAlchemy engine instance
 db_session : ContextManager
     Context manager for automatic session management
+db_read_session : ContextManager
+    Same as `db_session`, on `read_engine`
+remove_session : Callable
+    Discards the calling thread's session
 
 
 Notes
@@ -14,7 +20,8 @@ Notes
 - Made primarily by Github Copilot
 """
 
-from .engine import engine
-from .session import db_session
+from .engine import engine, read_engine
+from .session import db_session, db_read_session, remove_session
 
-__all__ = ['engine', 'db_session']
+__all__ = ['engine', 'read_engine', 'db_session', 'db_read_session',
+           'remove_session']
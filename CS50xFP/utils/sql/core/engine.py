@@ -5,23 +5,43 @@ Contains
 --------
 - create_db_engine
 - engine
+- read_engine
 
 Notes
 -----
-- engine is a global `Engine` instance created at import
+- engine & read_engine are global `Engine` instances created at import
 - Made primarily by Github Copilot
 """
 
-from sqlalchemy import Engine, create_engine
-from ...general.sql_config import Config, DEEPWELL_DIR, DB_URL
+from typing import Any, Callable
+
+from sqlalchemy import Engine, create_engine, event
+from ...general.sql_config import (
+                                   Config, DEEPWELL_DIR, DB_URL, DB_URL_RO,
+                                   configure_sqlite_connection,
+                                   configure_sqlite_reader
+                                  )
 from ...general.exceptions import DatabaseConnectionError
 
 
-def create_db_engine() -> Engine:
+def create_db_engine(
+                     url: str = DB_URL,
+                     pool: dict[str, Any] = Config.WRITER_POOL,
+                     on_connect: Callable[[Any, Any], None] = configure_sqlite_connection
+                    ) -> Engine:
     """
     Creates a new SQLAlchemy database engine with
     settings from config.py for pool & SQLite
 
+    Parameters
+    ----------
+    url : str = DB_URL
+        The database URL
+    pool : dict[str, Any] = Config.WRITER_POOL
+        The pool config settings
+    on_connect : Callable = configure_sqlite_connection
+        Applies the PRAGMAs to each new connection
+
     Returns
     -------
     sqlalchemy.engine.Engine
@@ -35,11 +55,13 @@ def create_db_engine() -> Engine:
         )
 
     try:
-        return create_engine(
-                             DB_URL,          # path to SQLite database
-                             **Config.POOL,   # unpack pool config settings
-                             **Config.SQLITE  # unpack SQLite config settings
-                            )
+        db_engine = create_engine(
+                                  url,             # path to SQLite database
+                                  **pool,          # unpack pool config settings
+                                  **Config.SQLITE  # unpack SQLite config settings
+                                 )
+        event.listen(db_engine, 'connect', on_connect)
+        return db_engine
 
     except Exception as e:
         raise DatabaseConnectionError(
@@ -47,8 +69,11 @@ def create_db_engine() -> Engine:
         ) from e
 
 
-# create a global engine instance, crashes import if init fails
+# create the global engines, crashes import if init fails
 engine = create_db_engine()
+"""Writer engine (one conn, writes queue for it)"""
+read_engine = create_db_engine(DB_URL_RO, Config.READER_POOL, configure_sqlite_reader)
+"""Read-only engine (`mode=ro`), for queries that don't write"""
 
 # === Exports ===
-__all__ = ['engine']
+__all__ = ['engine', 'read_engine']
@@ -5,14 +5,17 @@ Contains
 --------
 - Session_Factory
 - Session
+- ReadSession
 - db_session
+- db_read_session
+- remove_session
 
 Notes
 -----
 - Made primarily by Github Copilot
 """
 
-from .engine import engine
+from .engine import engine, read_engine
 from ...general.exceptions import DatabaseSessionError
 
 from sqlalchemy.orm import sessionmaker, scoped_session, \
@@ -21,10 +24,38 @@ from contextlib import contextmanager
 from typing import Generator
 
 # create a factory to generate new sessions
-_session_factory = sessionmaker(bind=engine)
+# (expire_on_commit=False prevents DetachedInstanceErrors)
+_session_factory = sessionmaker(bind=engine, expire_on_commit=False)
 # ensures each thread gets its own session
 Session = scoped_session(_session_factory)
 
+# same for the read-only engine
+_read_session_factory = sessionmaker(bind=read_engine, expire_on_commit=False)
+ReadSession = scoped_session(_read_session_factory)
+
+
+def _session_scope(
+                   registry: scoped_session[SessionType]
+                  ) -> Generator[SessionType, None, None]:
+    """Yields `registry`'s session, then commits (or rolls back) & closes it"""
+    session = None
+    try:
+        session = registry()  # this thread's session (reused between calls)
+        yield session         # give it to the caller
+        session.commit()      # commit what they did
+
+    except Exception as e:
+        if session:  # only rollback if session exists
+            session.rollback()
+
+        raise DatabaseSessionError(
+            f'Database session operation failed: {e}'
+        ) from e
+
+    finally:
+        if session:  # always close session if it exists
+            session.close()
+
 
 @contextmanager  # allows func to use `with`
 def db_session() -> Generator[SessionType, None, None]:
@@ -46,28 +77,37 @@ def db_session() -> Generator[SessionType, None, None]:
     >>> with db_session() as session:
     ...    session.add(some_object)
     ...    session.query(SomeModel)
+
+    Notes
+    -----
+    - Uses the single writer conn, queries that only read
+      should use `db_read_session()`
     """
+    yield from _session_scope(Session)
 
-    session = None
-    try:
-        session = Session()  # create a new session
-        session.expire_on_commit = False  # prevent DetachedInstanceErrors
-        yield session        # give it to the caller
-        session.commit()     # commit what they did
 
-    except Exception as e:
-        if session:  # only rollback if session exists
-            session.rollback()
+@contextmanager
+def db_read_session() -> Generator[SessionType, None, None]:
+    """
+    Like `db_session()`, but on the read-only engine
 
-        raise DatabaseSessionError(
-            f'Database session operation failed: {e}'
-        ) from e
+    Reads don't queue behind the writer, writes fail
+    with a `DatabaseSessionError` (readonly database)
+    """
+    yield from _session_scope(ReadSession)
 
-    finally:
-        if session:  # always close session if it exists
-            session.close()
+
+def remove_session() -> None:
+    """
+    Discards the calling thread's session
+
+    Call when a thread that used `db_session()` is done
+    (eg. a client handler thread closing its connection)
+    """
+    Session.remove()
+    ReadSession.remove()
 
 
 
 # === Exports ===
-__all__ = ['db_session']
+__all__ = ['db_session', 'db_read_session', 'remove_session']
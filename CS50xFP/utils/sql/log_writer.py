@@ -0,0 +1,166 @@
+"""
+Background audit log writer
+
+Contains
+--------
+- enqueue_event(user_id: int, user_ip: str, action: str, details: str, status: bool = True) -> None
+- flush() -> None
+
+Notes
+-----
+- Rows are written by a daemon thread in batches of up to `LOG_BATCH_S`,
+  at most `LOG_FLUSH_S` seconds after being queued
+- Trade-off: rows still queued when the process is killed are lost
+  (a normal exit flushes them via `atexit`)
+"""
+
+import atexit
+import sys
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import insert
+
+from .core import db_session
+from .schema import MainModels as ORMModels
+
+
+
+# === Config ===
+
+LOG_BATCH_S = 256
+"""Max audit log rows written per INSERT"""
+LOG_FLUSH_S = 0.05
+"""Max seconds a queued row waits for its batch to fill"""
+
+
+
+# === State ===
+
+_queue: SimpleQueue[dict[str, Any] | None] = SimpleQueue()
+"""Rows waiting to be written (None tells the writer to stop)"""
+
+_writer: Thread | None = None
+_writer_lock = Lock()
+
+
+
+# === Writer ===
+
+def _write(rows: list[dict[str, Any]]) -> None:
+    """Inserts `rows` into the audit log in one statement"""
+    try:
+        with db_session() as session:
+            session.execute(insert(ORMModels.AuditLog), rows)
+    except Exception as e:
+        # nowhere to raise to, don't kill the writer
+        print(
+              f'[Audit Log] Failed to write {len(rows)} rows: {e}',
+              file=sys.stderr
+             )
+
+
+def _run() -> None:
+    """Writer thread: batches queued rows until a None is queued"""
+    while True:
+        row = _queue.get()
+        if row is None:
+            return
+
+        batch = [row]
+        deadline = monotonic() + LOG_FLUSH_S
+
+        while len(batch) < LOG_BATCH_S:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+
+            try:
+                row = _queue.get(timeout=remaining)
+            except Empty:
+                break
+
+            if row is None:  # stopping, write what we have first
+                _write(batch)
+                return
+            batch.append(row)
+
+        _write(batch)
+
+
+def _start_writer() -> None:
+    """Starts the writer thread if it isn't running"""
+    global _writer
+
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = Thread(target=_run, name='audit_log', daemon=True)
+            _writer.start()
+
+
+
+# === Main Funcs ===
+
+def enqueue_event(
+                  user_id: int,
+                  user_ip: str,
+                  action: str,
+                  details: str,
+                  status: bool = True
+                 ) -> None:
+    """
+    Queues an event for the audit log (written in the background)
+
+    Parameters
+    ----------
+    user_id : int
+        The ID of the user performing the action
+    user_ip : str
+        The IP address of the user performing the action
+    action : str
+        A short description of the action
+    details : str
+        Additional details about the action
+    status : bool, default=True
+        The status of the action (successful or not)
+
+    Notes
+    -----
+    - Does not validate parameters (see `queries.log_event()`)
+    """
+    if _writer is None:
+        _start_writer()
+
+    _queue.put({
+        'user_id': user_id,
+        'user_ip': user_ip,
+        'action': action,
+        'details': details,
+        'status': status,
+    })
+
+
+@atexit.register
+def flush() -> None:
+    """
+    Writes all queued events & stops the writer thread
+
+    Called at exit, a later `enqueue_event()` starts a new writer
+    """
+    global _writer
+
+    with _writer_lock:
+        if _writer is None:
+            return
+
+        _queue.put(None)
+        _writer.join()
+        _writer = None
+
+
+
+# === Exports ===
+
+__all__ = ['enqueue_event', 'flush']
@@ -16,7 +16,7 @@ from sqlalchemy import select, func
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.orm import Session
 
-from .core import db_session
+from .core import db_session, db_read_session
 from .schema import MainModels as ORMModels, ORMBase, validate_table
 from ..general.exceptions import TableNotFoundError, RecordNotFoundError, \
                         DatabaseError, DatabaseSessionError, field_error
@@ -45,11 +45,11 @@ def db_session_manager(
                        model_class: type[ORMBase],
                        fields: list[str] = []
                       ) -> Generator[
-                                     tuple[str, Session, set[Any]],
+                                     tuple[str, Session, tuple[Any, ...]],
                                      None, None
                                     ]:
     """
-    Extends db_session to have basic validation
+    Extends db_read_session to have basic validation
 
     Parameters
     ----------
@@ -60,10 +60,10 @@ def db_session_manager(
 
     Yields
     ------
-    tuple[str, Session, set[Any]]
+    tuple[str, Session, tuple[Any, ...]]
         - Table name
         - SQLAlchemy session
-        - Set of model attributes (columns) corresponding to `fields`
+        - Model attributes (columns) corresponding to `fields` (same order)
 
 
     Raises
@@ -96,8 +96,8 @@ def db_session_manager(
             'list of unique field names'
         )
 
-    with db_session() as session:
-        yield t_name, session, set(attrs)
+    with db_read_session() as session:  # only used for lookups
+        yield t_name, session, tuple(attrs)
 
 
 
@@ -5,6 +5,7 @@ Exports
 -------
 - Constants
     - WK_HASH_REGEX
+    - ARGON2_HASH_REGEX
     - VALID_TABLES
     - VALID_MODELS
 - Validation helpers
@@ -36,6 +37,12 @@ from typing import Any
 WK_HASH_REGEX = r'scrypt:32768:8:1\$[A-Za-z0-9]{16}\$[A-Za-z0-9]{128}'
 """werkzeug hash regex for validation"""
 
+ARGON2_HASH_REGEX = (
+    r'\$argon2id\$v=19\$m=\d+,t=\d+,p=\d+'
+    r'\$[A-Za-z0-9+/]{22}\$[A-Za-z0-9+/]{43}'  # 16 byte salt, 32 byte hash
+)
+"""argon2id (PHC string) hash regex for validation"""
+
 VALID_TABLES = {
                 'users',
                 'scps',
@@ -218,7 +225,7 @@ def wk_hash(
             index: bool = True
            ) -> Column[str]:
     """
-    Returns a string column for storing a werkzeug password hash.
+    Returns a string column for storing a werkzeug (or argon2id) password hash.
 
     Parameters
     ----------
@@ -249,8 +256,8 @@ def col_datetime(
     """
     return Column(
                   DateTime,
-                  default=datetime.now(tz.utc),
-                  onupdate=datetime.now(tz.utc) if onupdate else None,
+                  default=lambda: datetime.now(tz.utc),
+                  onupdate=(lambda: datetime.now(tz.utc)) if onupdate else None,
                   nullable=nullable,
                   index=index
                  )
@@ -355,6 +362,7 @@ class ORMBase(DeclarativeBase):
 __all__ = [
            # constants
            'WK_HASH_REGEX',
+           'ARGON2_HASH_REGEX',
            'VALID_TABLES',
            'VALID_MODELS',
 
@@ -3,7 +3,7 @@ Main DB table definitions
 """
 
 from .base import ORMBase, MainTableMixin, col_int_fk, col_str, wk_hash, \
-                  col_datetime, rel, WK_HASH_REGEX
+                  col_datetime, rel, WK_HASH_REGEX, ARGON2_HASH_REGEX
 from .helpers import ClearanceLvl, ContainmentClass, SecondaryClass, \
                      Title, DisruptionClass, RiskClass
 
@@ -52,7 +52,7 @@ class User(MainTableMixin, ORMBase):
     @validates('password', 'override_phrase')
     def validate_hash(self, key: str, value: str) -> str:
         """
-        Validates Werkzeug password hash format
+        Validates password hash format (Werkzeug or argon2id)
 
         Parameters
         ----------
@@ -64,17 +64,20 @@ class User(MainTableMixin, ORMBase):
         Raises
         ------
         ValueError
-            - If `value` does not match Werkzeug hash format
+            - If `value` does not match Werkzeug or argon2id hash format
 
         Returns
         -------
         str
             The validated value
         """
-        if not re.fullmatch(WK_HASH_REGEX, value):
+        if not (
+            re.fullmatch(WK_HASH_REGEX, value)
+            or re.fullmatch(ARGON2_HASH_REGEX, value)
+        ):
             raise ValueError(
-                             f'Error with {key!r}: '
-                             'Provided value is not a valid Werkzeug hash'
+                             f'Error with {key!r}: Provided value is not '
+                             'a valid Werkzeug or argon2id hash'
                             )
         return value
 
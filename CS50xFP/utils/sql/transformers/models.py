@@ -674,9 +674,13 @@ def get_scp_colours(scp: SCP) -> SCPColours:
         the generated SCPColours object
     """
     clear_lvl = Styles.CLEAR_LVL[scp.clearance_lvl.id]
-    cont_class = Styles.CONT_CLASS[scp.containment_class.name]
+    cont_class = Styles.CONT_CLASS.get(
+        scp.containment_class.name, Styles.OTHER_CONT_CLASS
+    )
     if scp.secondary_class:
-        scnd_class = Styles.CONT_CLASS[scp.secondary_class.name]
+        scnd_class = Styles.CONT_CLASS.get(
+            scp.secondary_class.name, Styles.OTHER_CONT_CLASS
+        )
     else:
         scnd_class = Styles.OTHER_CONT_CLASS
     if scp.disruption_class:
@@ -0,0 +1,212 @@
+"""
+Tests for the access cache in utils.server.actions
+
+Reads the deepwell db (skipped without it). Each test's file directory is a
+copy in `tmp_path`, so editing it doesn't touch the deepwell
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import event, select
+
+from utils.server import actions
+from utils.sql.core import db_read_session, read_engine
+from utils.sql.schema import MainModels as ORMModels
+from utils.sql.transformers import Models as PydanticModels, orm_to_pydantic
+from utils.general.server_config import Server
+from utils.general.sql_config import DB_PATH, EXPUNGED
+
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not DB_PATH.exists(), reason='needs the deepwell db'),
+]
+
+IP = '127.0.0.1'
+
+
+# === Fixtures ===
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Starts each test with an empty cache & no audit log writes"""
+    monkeypatch.setattr(actions, 'log_access', lambda *args: None)
+    actions.clear_access_cache()
+    yield
+    actions.clear_access_cache()
+
+
+@pytest.fixture(scope='module')
+def user() -> PydanticModels.User:
+    """User 1 (clearance 6, can see every file)"""
+    with db_read_session() as session:
+        return orm_to_pydantic(session.get(
+            ORMModels.User, 1,
+            options=actions._LOAD_OPTIONS[ORMModels.User]
+        ))
+
+
+@pytest.fixture
+def queries() -> Iterator[list[str]]:
+    """The statements run on the read engine during a test"""
+    ran: list[str] = []
+
+    def count(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        ran.append(statement)
+
+    event.listen(read_engine, 'before_cursor_execute', count)
+    yield ran
+    event.remove(read_engine, 'before_cursor_execute', count)
+
+
+def _copy_files(
+                monkeypatch: pytest.MonkeyPatch,
+                tmp_path: Path,
+                f_type: str,
+                f_id: int
+               ) -> Path:
+    """Copies a file's directory to `tmp_path` & points `access()` at it"""
+    f_dir = tmp_path / str(f_id)
+    shutil.copytree(actions._f_path(f_type, f_id), f_dir)
+    monkeypatch.setattr(actions, '_f_path', lambda *args: str(f_dir))
+    return f_dir
+
+
+@pytest.fixture
+def mtf_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    return _copy_files(monkeypatch, tmp_path, 'MTF', 1)
+
+
+@pytest.fixture
+def scp_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    return _copy_files(monkeypatch, tmp_path, 'SCP', 49)
+
+
+def _edit(path: Path, text: str) -> None:
+    """Rewrites `path` in place with a later mtime (no same-tick edits)"""
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+def _files(msg: Any) -> dict[str, Any]:
+    return msg['data']['files']
+
+
+# === File Stamps ===
+
+def test_entry_reused(mtf_dir, user, queries):
+    first = actions.access('MTF', 1, user, IP)
+    queries.clear()
+
+    assert actions.access('MTF', 1, user, IP) is first
+    assert queries == []
+
+
+def test_in_place_edit_rebuilds(mtf_dir, user):
+    first = actions.access('MTF', 1, user, IP)
+    _edit(mtf_dir / 'mission.md', 'edited mission')
+
+    second = actions.access('MTF', 1, user, IP)
+
+    assert second is not first
+    assert _files(second)['mission'] == 'edited mission'
+    assert actions.access('MTF', 1, user, IP) is second
+
+
+def test_removed_file_rebuilds(mtf_dir, user):
+    actions.access('MTF', 1, user, IP)
+    (mtf_dir / 'mission.md').unlink()
+
+    assert _files(actions.access('MTF', 1, user, IP))['mission'] == EXPUNGED
+
+
+def test_new_addendum_rebuilds(scp_dir, user):
+    before = _files(actions.access('SCP', 49, user, IP))['addenda']
+    _edit(scp_dir / 'addenda' / 'test addendum.md', 'new addendum')
+
+    after = _files(actions.access('SCP', 49, user, IP))['addenda']
+
+    assert after == {**before, 'test addendum.md': 'new addendum'}
+
+
+def test_addendum_edit_rebuilds(scp_dir, user):
+    addendum = next((scp_dir / 'addenda').iterdir())
+    actions.access('SCP', 49, user, IP)
+    _edit(addendum, 'edited addendum')
+
+    addenda = _files(actions.access('SCP', 49, user, IP))['addenda']
+
+    assert addenda[addendum.name] == 'edited addendum'
+
+
+# === TTL ===
+
+def _advance(monkeypatch: pytest.MonkeyPatch, seconds: float) -> None:
+    """Makes `access()` see the clock `seconds` ahead"""
+    now = actions.monotonic_ns()
+    monkeypatch.setattr(
+        actions, 'monotonic_ns', lambda: now + int(seconds * 10**9)
+    )
+
+
+def test_entry_kept_before_ttl(monkeypatch, mtf_dir, user, queries):
+    first = actions.access('MTF', 1, user, IP)
+    queries.clear()
+    _advance(monkeypatch, Server.ACCESS_CACHE_TTL - 1)
+
+    assert actions.access('MTF', 1, user, IP) is first
+    assert queries == []
+
+
+def test_expired_entry_reloaded(monkeypatch, mtf_dir, user, queries):
+    """Reloaded from the db even though no file changed"""
+    first = actions.access('MTF', 1, user, IP)
+    queries.clear()
+    _advance(monkeypatch, Server.ACCESS_CACHE_TTL + 1)
+
+    second = actions.access('MTF', 1, user, IP)
+
+    assert second is not first
+    assert second == first
+    assert queries != []
+
+    queries.clear()
+    assert actions.access('MTF', 1, user, IP) is second
+    assert queries == []
+
+
+def test_clear_access_cache_reloads(mtf_dir, user, queries):
+    first = actions.access('MTF', 1, user, IP)
+    queries.clear()
+    actions.clear_access_cache()
+
+    assert actions.access('MTF', 1, user, IP) is not first
+    assert queries != []
+
+
+def test_clearance_index_expires(monkeypatch, user, queries):
+    """A cached denial skips the db until the TTL passes"""
+    with db_read_session() as session:
+        scp_id = session.scalar(
+            select(ORMModels.SCP.id)
+            .where(ORMModels.SCP.clearance_lvl_id > 1)
+            .limit(1)
+        )
+    low = user.model_copy(update={
+        'clearance_lvl': user.clearance_lvl.model_copy(update={'id': 1})
+    })
+
+    assert actions.access('SCP', scp_id, low, IP)['type'] == 'access_redacted'
+    queries.clear()
+
+    assert actions.access('SCP', scp_id, low, IP)['type'] == 'access_redacted'
+    assert queries == []
+
+    _advance(monkeypatch, Server.ACCESS_CACHE_TTL + 1)
+    assert actions.access('SCP', scp_id, low, IP)['type'] == 'access_redacted'
+    assert queries != []
@@ -0,0 +1,123 @@
+"""
+Tests for the login cache in utils.server.basic
+
+Logs in as user 1 against the deepwell db (skipped without it)
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import pytest
+
+from utils.server import basic
+from utils.server.basic import auth_usr, invalidate_auth
+from utils.general.server_config import Server
+from utils.general.sql_config import DB_PATH
+
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not DB_PATH.exists(), reason='needs the deepwell db'),
+]
+
+USER_ID = 1
+PASSWORD = 'InSAne'
+
+
+# === Fixtures ===
+
+@pytest.fixture(autouse=True)
+def fresh_cache() -> Iterator[None]:
+    basic._auth_cache.clear()
+    yield
+    basic._auth_cache.clear()
+
+
+@pytest.fixture
+def reads(monkeypatch: pytest.MonkeyPatch) -> list[None]:
+    """One item per db lookup `auth_usr()` makes"""
+    opened: list[None] = []
+    db_read_session = basic.db_read_session
+
+    @contextmanager
+    def counted() -> Iterator[Any]:
+        opened.append(None)
+        with db_read_session() as session:
+            yield session
+
+    monkeypatch.setattr(basic, 'db_read_session', counted)
+    return opened
+
+
+def _advance(monkeypatch: pytest.MonkeyPatch, seconds: float) -> None:
+    """Makes `auth_usr()` see the clock `seconds` ahead"""
+    now = basic.monotonic_ns()
+    monkeypatch.setattr(
+        basic, 'monotonic_ns', lambda: now + int(seconds * 10**9)
+    )
+
+
+# === Hits & Misses ===
+
+def test_login_cached(reads):
+    failed, user = auth_usr(USER_ID, PASSWORD)
+    assert failed is None
+
+    assert auth_usr(USER_ID, PASSWORD) == (None, user)
+    assert len(reads) == 1
+
+
+def test_wrong_password_not_cached(reads):
+    auth_usr(USER_ID, PASSWORD)
+
+    assert auth_usr(USER_ID, PASSWORD + 'x') == ('password', None)
+    assert auth_usr(USER_ID, PASSWORD + 'x') == ('password', None)
+    assert len(reads) == 3
+
+
+def test_invalidate_auth(reads):
+    auth_usr(USER_ID, PASSWORD)
+    invalidate_auth(USER_ID)
+
+    assert auth_usr(USER_ID, PASSWORD)[0] is None
+    assert len(reads) == 2
+
+
+# === TTL & LRU ===
+
+def test_login_kept_before_ttl(monkeypatch, reads):
+    auth_usr(USER_ID, PASSWORD)
+    _advance(monkeypatch, Server.AUTH_CACHE_TTL - 1)
+
+    auth_usr(USER_ID, PASSWORD)
+    assert len(reads) == 1
+
+
+def test_expired_login_rechecked(monkeypatch, reads):
+    auth_usr(USER_ID, PASSWORD)
+    _advance(monkeypatch, Server.AUTH_CACHE_TTL + 1)
+
+    assert auth_usr(USER_ID, PASSWORD)[0] is None
+    assert len(reads) == 2
+    assert len(basic._auth_cache) == 1
+
+
+def test_lru_evicts_least_recent(monkeypatch, reads):
+    """A hit keeps an entry, the least recently used one is evicted"""
+    monkeypatch.setattr(Server, 'AUTH_CACHE_S', 2)
+    _, user = auth_usr(USER_ID, PASSWORD)
+    reads.clear()
+
+    # two other cached logins, `old` used before `kept`
+    expiry = basic.monotonic_ns() + Server.AUTH_CACHE_TTL * 10**9
+    old = basic._auth_key(900, 'old')
+    kept = basic._auth_key(901, 'kept')
+    basic._auth_cache.clear()
+    basic._auth_cache[old] = (expiry, user)
+    basic._auth_cache[kept] = (expiry, user)
+
+    assert auth_usr(900, 'old') == (None, user)  # hit: now most recent
+    auth_usr(USER_ID, PASSWORD)                  # miss: evicts `kept`
+
+    assert list(basic._auth_cache) == [old, basic._auth_key(USER_ID, PASSWORD)]
+    assert len(reads) == 1
@@ -0,0 +1,86 @@
+"""
+Tests for client timeouts in utils.server.main.serve
+
+Serves on an ephemeral port from a daemon thread, with every login
+failing (so no db is needed)
+"""
+
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from typing import Iterator
+
+import pytest
+
+from utils.server import main
+from utils.socket import send, recv, MessageTypes
+from utils.general.server_config import Server
+
+
+TIMEOUT = 0.5
+"""`Server.CLIENT_TIMEOUT` while testing"""
+
+
+# === Fixtures ===
+
+@pytest.fixture
+def addr(monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[str, int]]:
+    """Address of a server with 2 workers (runs until the tests exit)"""
+    monkeypatch.setattr(Server, 'CLIENT_TIMEOUT', TIMEOUT)
+    monkeypatch.setattr(main, 'auth_usr', lambda *args: ('password', None))
+
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(16)
+    pool = ThreadPoolExecutor(2)
+    Thread(target=main.serve, args=(server, pool), daemon=True).start()
+
+    yield server.getsockname()
+    pool.shutdown(wait=False)
+
+
+def _connect(addr: tuple[str, int]) -> socket.socket:
+    conn = socket.create_connection(addr)
+    conn.settimeout(5)
+    return conn
+
+
+def _login(conn: socket.socket) -> str:
+    send(conn, MessageTypes.AUTH_REQUEST, {'user_id': 1, 'password': 'x'})
+    return recv(conn)['type']
+
+
+# === Timeouts ===
+
+def test_stalled_client_closed(addr):
+    conn = _connect(addr)
+    conn.sendall(b'\x00\x00')  # half a size header
+
+    start = time.monotonic()
+    assert conn.recv(1) == b''
+    assert time.monotonic() - start < TIMEOUT * 4
+    conn.close()
+
+
+def test_stalled_clients_dont_block_others(addr):
+    """Clients stalled mid request on every worker are dropped"""
+    stalled = [_connect(addr) for _ in range(2)]
+    for conn in stalled:
+        conn.sendall(b'\x00\x00')
+    time.sleep(0.1)
+
+    conn = _connect(addr)
+    assert _login(conn) == MessageTypes.AUTH_FAILED
+
+    for s in [conn, *stalled]:
+        s.close()
+
+
+def test_idle_client_kept(addr):
+    """Waiting between requests isn't a stall"""
+    conn = _connect(addr)
+    time.sleep(TIMEOUT * 2)
+
+    assert _login(conn) == MessageTypes.AUTH_FAILED
+    conn.close()
@@ -0,0 +1,204 @@
+"""
+Tests for message framing in utils.socket.transport
+
+Sends over a `socket.socketpair()`, so no server is needed.
+Every test runs with orjson & with the json module fallback
+"""
+
+import importlib
+import socket
+import sys
+from threading import Thread, Timer
+from typing import Iterator
+
+import pytest
+
+from utils.socket import Msg, send_msg, send_many, recv, has_pending, \
+                         MessageTypes
+from utils.socket import helpers
+from utils.socket.helpers import encode
+from utils.general.server_config import Socket as SockConf
+
+
+# === Fixtures ===
+
+@pytest.fixture(params=['orjson', 'json'])
+def codec(
+          request: pytest.FixtureRequest,
+          monkeypatch: pytest.MonkeyPatch
+         ) -> Iterator[str]:
+    """Runs a test with orjson, then with the json module fallback"""
+    if request.param == 'orjson':
+        if helpers.orjson is None:
+            pytest.skip('orjson is not installed')
+        yield request.param
+        return
+
+    # re-run the helpers module with orjson blocked; the functions
+    # transport imported read the codec from the same module globals
+    saved = vars(helpers).copy()
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    importlib.reload(helpers)
+
+    try:
+        yield request.param
+    finally:
+        vars(helpers).update(saved)
+
+
+@pytest.fixture
+def pair(codec: str) -> Iterator[tuple[socket.socket, socket.socket]]:
+    """A connected `(sender, receiver)` pair (the receiver times out)"""
+    a, b = socket.socketpair()
+    b.settimeout(5)
+    try:
+        yield a, b
+    finally:
+        a.close()
+        b.close()
+
+
+def _send_later(conn: socket.socket, data: bytes) -> Thread:
+    """Sends `data` from a thread (for writes bigger than the socket buffer)"""
+    thread = Thread(target=conn.sendall, args=(data,), daemon=True)
+    thread.start()
+    return thread
+
+
+# === Framing ===
+
+def test_codec(codec):
+    assert (helpers.orjson is None) == (codec == 'json')
+
+
+def test_single_message(pair):
+    a, b = pair
+    msg = Msg.access_expunged('SCP', 173)
+
+    send_msg(a, msg)
+
+    assert recv(b) == msg
+    assert not has_pending(b)
+
+
+def test_pipelined_frames(pair):
+    """Frames read in one recv are split, the rest is kept for the next call"""
+    a, b = pair
+    msgs = [Msg.access_expunged('SCP', i) for i in range(1, 4)]
+
+    a.sendall(b''.join(encode(msg) for msg in msgs))
+
+    assert recv(b) == msgs[0]
+    assert has_pending(b)
+    assert recv(b) == msgs[1]
+    assert recv(b) == msgs[2]
+    assert not has_pending(b)
+
+
+def test_header_split_across_reads(pair):
+    a, b = pair
+    msg = Msg.auth_failed('user_id')
+    frame = encode(msg)
+
+    a.sendall(frame[:2])
+    Timer(0.05, a.sendall, (frame[2:],)).start()
+
+    assert recv(b) == msg
+
+
+def test_body_split_across_reads(pair):
+    a, b = pair
+    msg = Msg.auth_failed('user_id')
+    frame = encode(msg)
+
+    a.sendall(frame[:SockConf.HEADER_S + 3])
+    Timer(0.05, a.sendall, (frame[SockConf.HEADER_S + 3:],)).start()
+
+    assert recv(b) == msg
+
+
+def test_large_body(pair):
+    """A body bigger than `SockConf.RCV_S` is read in several pieces"""
+    a, b = pair
+    msg = Msg.auth_failed('x' * 200_000)
+    frame = encode(msg)
+    assert len(frame) > SockConf.RCV_S
+
+    writer = _send_later(a, frame)
+
+    assert recv(b) == msg
+    assert not has_pending(b)
+    writer.join(5)
+
+
+def test_large_body_after_pipelined_frame(pair):
+    """A large body that starts in the read-ahead of the previous message"""
+    a, b = pair
+    small = Msg.access_expunged('USER', 1)
+    large = Msg.auth_failed('é' * 100_000)
+
+    writer = _send_later(a, encode(small) + encode(large))
+
+    assert recv(b) == small
+    assert recv(b) == large
+    writer.join(5)
+
+
+def test_send_many(pair):
+    a, b = pair
+
+    send_many(
+              a,
+              (MessageTypes.AUTH_FAILED, {'field': 'é'}),
+              (MessageTypes.ACCESS_EXPUNGED, {'f_type': 'SCP', 'f_id': 3}),
+             )
+
+    assert recv(b) == Msg.auth_failed('é')
+    assert recv(b) == Msg.access_expunged('SCP', 3)
+
+
+# === EOF ===
+
+def test_eof_before_message(pair):
+    a, b = pair
+    a.close()
+
+    with pytest.raises(ConnectionError):
+        recv(b)
+
+
+def test_eof_mid_header(pair):
+    a, b = pair
+    a.sendall(encode(Msg.auth_failed('user_id'))[:2])
+    a.close()
+
+    with pytest.raises(ConnectionError):
+        recv(b)
+
+
+def test_eof_mid_body(pair):
+    a, b = pair
+    frame = encode(Msg.auth_failed('x' * 200_000))
+
+    def send_half() -> None:
+        a.sendall(frame[:len(frame) // 2])
+        a.shutdown(socket.SHUT_WR)
+
+    writer = Thread(target=send_half, daemon=True)
+    writer.start()
+
+    with pytest.raises(ConnectionError):
+        recv(b)
+    writer.join(5)
+
+
+def test_eof_after_pipelined_frame(pair):
+    """A kept partial frame followed by EOF still raises"""
+    a, b = pair
+    msg = Msg.access_expunged('SCP', 1)
+    a.sendall(encode(msg) + encode(msg)[:3])
+    a.close()
+
+    assert recv(b) == msg
+    with pytest.raises(ConnectionError):
+        recv(b)
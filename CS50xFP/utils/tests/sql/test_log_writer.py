@@ -0,0 +1,103 @@
+"""
+Tests for the background audit log writer in utils.sql.log_writer
+
+Rows are recorded instead of inserted, so no db is needed
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import pytest
+
+from utils.sql import log_writer
+from utils.sql.log_writer import enqueue_event, flush
+
+
+_WRITE = log_writer._write
+"""The real `_write()` (the `batches` fixture replaces it)"""
+
+
+# === Fixtures ===
+
+@pytest.fixture(autouse=True)
+def batches(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[list[dict[str, Any]]]]:
+    """The batches the writer thread writes (in write order)"""
+    flush()  # don't record rows queued before the test
+    written: list[list[dict[str, Any]]] = []
+    monkeypatch.setattr(log_writer, '_write', written.append)
+    yield written
+    flush()
+
+
+def _enqueue(n: int) -> None:
+    for i in range(n):
+        enqueue_event(1, '127.0.0.1', 'test', f'event {i}')
+
+
+def _details(batches: list[list[dict[str, Any]]]) -> list[str]:
+    return [row['details'] for batch in batches for row in batch]
+
+
+# === flush() ===
+
+def test_flush_drains_queue(batches):
+    _enqueue(1000)
+    flush()
+
+    assert _details(batches) == [f'event {i}' for i in range(1000)]
+    assert all(len(b) <= log_writer.LOG_BATCH_S for b in batches)
+    assert log_writer._writer is None
+
+
+def test_flush_without_writer(batches):
+    flush()
+    flush()
+
+    assert batches == []
+    assert log_writer._writer is None
+
+
+def test_enqueue_after_flush(batches):
+    _enqueue(1)
+    flush()
+    _enqueue(2)
+
+    assert log_writer._writer is not None
+    flush()
+    assert _details(batches) == ['event 0', 'event 0', 'event 1']
+
+
+# === Background writes ===
+
+def test_written_without_flush(batches):
+    """A lone row is written once `LOG_FLUSH_S` passes"""
+    _enqueue(1)
+
+    deadline = time.monotonic() + 5
+    while not batches and time.monotonic() < deadline:
+        time.sleep(log_writer.LOG_FLUSH_S)
+
+    assert _details(batches) == ['event 0']
+
+
+def test_failed_write_keeps_writer(monkeypatch, capsys):
+    """A failed insert is reported, the writer keeps running"""
+    monkeypatch.setattr(log_writer, '_write', _WRITE)
+
+    @contextmanager
+    def failing_session() -> Iterator[Any]:
+        raise RuntimeError('db is gone')
+        yield
+
+    monkeypatch.setattr(log_writer, 'db_session', failing_session)
+    _enqueue(1)
+
+    err = ''
+    deadline = time.monotonic() + 5
+    while not err and time.monotonic() < deadline:
+        time.sleep(log_writer.LOG_FLUSH_S)
+        err = capsys.readouterr().err
+
+    assert 'Failed to write 1 rows: db is gone' in err
+    assert log_writer._writer is not None and log_writer._writer.is_alive()